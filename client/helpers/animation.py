@@ -0,0 +1,124 @@
+# Shared frame clock for animated widgets
+import math
+import time
+from helpers.refresh import seconds_until_display_change
+
+DEFAULT_FPS = 30
+
+
+class FrameClock:
+    """
+    Drives every animation in the process from one timer. Each animation
+    reports when its picture next changes, and the clock sleeps until the
+    earliest of those, but never wakes more than fps times per second. Ten
+    animated counters therefore cost one wake-up per frame instead of ten,
+    and a counter whose shown digits move slower than the frame rate is
+    only drawn when they do.
+
+    An animation is any object with draw(now) -> next change timestamp.
+    """
+
+    def __init__(self, call_later, cancel_call, fps=DEFAULT_FPS, clock=time.time):
+        """
+        Args:
+            call_later: function(delay_ms, callback) -> handle, e.g. root.after
+            cancel_call: function(handle), e.g. root.after_cancel
+            fps: int - highest frame rate
+            clock: function returning wall-clock seconds
+        """
+        self.call_later = call_later
+        self.cancel_call = cancel_call
+        self.frame_ms = 1000 / fps
+        self.clock = clock
+        self.animations = {}  # animation -> due timestamp, or None while paused
+        self._timer = None
+        self.stats = {'frames': 0, 'draws': 0}
+
+    def add(self, animation):
+        """Start an animation; it is drawn on the next frame."""
+        self.animations[animation] = 0.0
+        self._arm()
+
+    def remove(self, animation):
+        """Stop an animation. Unknown animations are ignored."""
+        self.animations.pop(animation, None)
+
+    def pause(self, animation):
+        """Skip an animation until resume(), e.g. while its window is hidden."""
+        if animation in self.animations:
+            self.animations[animation] = None
+
+    def resume(self, animation):
+        """Draw a paused animation again from the next frame."""
+        if animation in self.animations:
+            self.animations[animation] = 0.0
+            self._arm()
+
+    def _arm(self):
+        """Make sure a frame is scheduled for the earliest due animation."""
+        due = [t for t in self.animations.values() if t is not None]
+        if self._timer is not None:
+            self.cancel_call(self._timer)
+            self._timer = None
+        if not due:
+            return  # Idle until add() or resume()
+        delay_ms = max(0, math.ceil((min(due) - self.clock()) * 1000))
+        self._timer = self.call_later(delay_ms, self._frame)
+
+    def _frame(self):
+        """Draw every animation due in this frame, then sleep until the next change."""
+        self._timer = None
+        self.stats['frames'] += 1
+        now = self.clock()
+        # Anything changing within this frame is drawn now
+        horizon = now + self.frame_ms / 2000
+        next_frame = now + self.frame_ms / 1000
+        for animation, due in list(self.animations.items()):
+            if due is None or due > horizon:
+                continue
+            self.stats['draws'] += 1
+            try:
+                due = animation.draw(now)
+            except Exception as e:
+                print(f"Warning: Animation failed: {e}")
+                due = None
+            if animation in self.animations:
+                # Frame rate caps how soon it is drawn again
+                self.animations[animation] = None if due is None else max(due, next_frame)
+        self._arm()
+
+    def summary(self):
+        """One-line frame/draw report."""
+        return f"Animation: {self.stats['frames']} frames, {self.stats['draws']} draws"
+
+
+class CounterAnimation:
+    """
+    A number that moves continuously over time, e.g. dividend accrued so
+    far, drawn whenever its rounded value changes.
+    """
+
+    def __init__(self, render, value_at, rate_at, template="{:.6f}", decimals=6, max_wait=1.0):
+        """
+        Args:
+            render: function(text) drawing the formatted value
+            value_at: function(timestamp) -> value
+            rate_at: function(timestamp) -> value change per second
+            template: str - format string for the value
+            decimals: int - decimals shown by template
+            max_wait: float - longest sleep between draws, so rate changes
+                      and rebuilt data are picked up
+        """
+        self.render = render
+        self.value_at = value_at
+        self.rate_at = rate_at
+        self.template = template
+        self.decimals = decimals
+        self.max_wait = max_wait
+
+    def draw(self, now):
+        """Render the value at now and return when the shown digits next change."""
+        value = self.value_at(now)
+        self.render(self.template.format(value))
+        change_in = seconds_until_display_change(value, self.rate_at(now), self.decimals)
+        return now + min(change_in, self.max_wait)
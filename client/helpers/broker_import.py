@@ -0,0 +1,261 @@
+# Import holdings from broker transaction exports
+import os
+import csv
+import json
+import hashlib
+import datetime
+import tempfile
+import numpy as np
+
+# One row per open position. Fixed-width fields keep the array free of
+# Python objects so it can be saved as .npy and memory-mapped back.
+POSITION_DTYPE = np.dtype([
+    ('symbol', 'U24'),
+    ('currency', 'U3'),
+    ('quantity', 'f8'),
+    ('cost_basis', 'f8'),      # Average purchase price per share
+    ('acquired', 'datetime64[D]'),  # Date the current position was opened
+])
+
+# Header names seen in broker exports, mapped to the fields we need
+COLUMN_ALIASES = {
+    'date': ('date', 'trade date', 'handelsdag', 'bogføringsdag', 'dato'),
+    'type': ('type', 'transaction type', 'transaktionstype', 'action'),
+    'symbol': ('symbol', 'ticker', 'værdipapirer', 'instrument', 'isin'),
+    'quantity': ('quantity', 'antal', 'shares'),
+    'price': ('price', 'kurs'),
+    'currency': ('currency', 'valuta'),
+}
+
+BUY_TYPES = {'buy', 'bought', 'køb', 'købt', 'køb af værdipapir'}
+SELL_TYPES = {'sell', 'sold', 'salg', 'solgt', 'salg af værdipapir'}
+
+# Danish header names; exports using them write decimal commas
+DANISH_HEADERS = {'handelsdag', 'bogføringsdag', 'dato', 'transaktionstype', 'værdipapirer', 'antal', 'kurs', 'valuta'}
+
+SNAPSHOT_SUFFIX = '.positions.npy'
+# Bump when parsing changes, so snapshots made by older parsers are redone
+PARSER_VERSION = 2
+KEY_SUFFIX = '.positions.json'
+
+
+def parse_number(text, decimal=None):
+    """
+    Parse '1234.5', '1,234.5', '1.234,5' or '1 234,5' into a float.
+
+    Args:
+        text: str - number as written in the export
+        decimal: str - ',' or '.' when the file's convention is known;
+                 the other character is then thousands grouping
+
+    Without a known convention, the rightmost of ',' and '.' is the
+    decimal separator. A single separator followed by exactly three
+    digits ('1,234') is only accepted as decimals after a leading '0'
+    ('0.125'); otherwise it could be either, so it is rejected.
+
+    Raises:
+        ValueError: for unreadable or ambiguous numbers
+    """
+    text = text.strip().replace(' ', '').replace('\xa0', '')
+    if not text:
+        return 0.0
+    separators = [char for char in text if char in ',.']
+    if separators and decimal is None:
+        decimal = separators[-1]
+        if len(set(separators)) == 1 and len(separators) > 1:
+            decimal = '.' if decimal == ',' else ','  # '1.234.567': only grouping
+        elif len(separators) == 1 and len(text) - text.index(decimal) - 1 == 3 \
+                and text.lstrip('+-').split(decimal)[0] != '0':
+            raise ValueError(f"Ambiguous number '{text}', thousands or decimal separator?")
+    if separators:
+        thousands = '.' if decimal == ',' else ','
+        if text.count(decimal) > 1:
+            raise ValueError(f"Unreadable number '{text}'")
+        text = text.replace(thousands, '').replace(decimal, '.')
+    return float(text)
+
+
+def parse_date(text):
+    """Parse 'YYYY-MM-DD' or 'DD-MM-YYYY' (also with / or .) into a date."""
+    text = text.strip()[:10].replace('/', '-').replace('.', '-')
+    parts = text.split('-')
+    if len(parts[0]) == 4:
+        return datetime.date(int(parts[0]), int(parts[1]), int(parts[2]))
+    return datetime.date(int(parts[2]), int(parts[1]), int(parts[0]))
+
+
+def _open_export(path):
+    """Open a CSV export, honouring the UTF-16 files some brokers write."""
+    with open(path, 'rb') as f:
+        bom = f.read(2)
+    encoding = 'utf-16' if bom in (b'\xff\xfe', b'\xfe\xff') else 'utf-8-sig'
+    return open(path, 'r', encoding=encoding, newline='')
+
+
+def _map_columns(header):
+    """Find the index of each needed field in a header row."""
+    lookup = {name.strip().lower(): i for i, name in enumerate(header)}
+    columns = {}
+    for field, aliases in COLUMN_ALIASES.items():
+        for alias in aliases:
+            if alias in lookup:
+                columns[field] = lookup[alias]
+                break
+    missing = {'date', 'type', 'symbol', 'quantity', 'price'} - set(columns)
+    if missing:
+        raise ValueError(f"Missing columns in export: {', '.join(sorted(missing))}")
+    return columns
+
+
+def _decimal_separator(delimiter, header):
+    """
+    Decide the file's decimal separator once from its layout: semicolon
+    separated files and Danish column names use decimal comma, everything
+    else decimal point.
+    """
+    names = {name.strip().lower() for name in header}
+    return ',' if delimiter == ';' or names & DANISH_HEADERS else '.'
+
+
+def parse_transactions(path):
+    """
+    Stream a transaction export into open positions.
+
+    Rows are read one at a time, so memory use depends on the number of
+    symbols, not the length of the history. Cost basis uses the average
+    cost method: buys add to it, sells remove their share of it.
+
+    Args:
+        path: str - CSV (or tab separated) transaction export
+
+    Returns:
+        numpy structured array with POSITION_DTYPE, one row per open position
+    """
+    positions = {}  # symbol -> [quantity, total cost, currency, acquired]
+
+    with _open_export(path) as f:
+        first_line = f.readline()
+        try:
+            delimiter = csv.Sniffer().sniff(first_line, delimiters=',;\t').delimiter
+        except csv.Error:
+            delimiter = ','  # Single column or empty file; _map_columns reports what's missing
+        header = next(csv.reader([first_line], delimiter=delimiter))
+        columns = _map_columns(header)
+        decimal = _decimal_separator(delimiter, header)
+        width = max(columns.values()) + 1
+
+        for line, row in enumerate(csv.reader(f, delimiter=delimiter), start=2):
+            if len(row) < width:
+                continue
+            kind = row[columns['type']].strip().lower()
+            if kind not in BUY_TYPES and kind not in SELL_TYPES:
+                continue  # Dividends, fees, deposits ...
+
+            # A skipped buy or sell would leave every later figure for the
+            # symbol wrong, so an unreadable trade fails the whole import
+            try:
+                symbol = row[columns['symbol']].strip()
+                quantity = abs(parse_number(row[columns['quantity']], decimal))
+                price = parse_number(row[columns['price']], decimal)
+                date = parse_date(row[columns['date']])
+            except (ValueError, IndexError) as e:
+                raise ValueError(f"Unreadable transaction on line {line} {row}: {e}") from e
+            currency = row[columns['currency']].strip() if 'currency' in columns else 'DKK'
+
+            position = positions.get(symbol)
+            if position is None or position[0] <= 0:
+                position = positions[symbol] = [0.0, 0.0, currency, date]
+
+            if kind in BUY_TYPES:
+                position[0] += quantity
+                position[1] += quantity * price
+            else:
+                average = position[1] / position[0] if position[0] else 0.0
+                sold = min(quantity, position[0])
+                position[0] -= sold
+                position[1] -= sold * average
+
+    open_positions = [(symbol, *position) for symbol, position in positions.items() if position[0] > 1e-9]
+    result = np.empty(len(open_positions), dtype=POSITION_DTYPE)
+    for i, (symbol, quantity, cost, currency, acquired) in enumerate(open_positions):
+        result[i] = (symbol, currency, quantity, cost / quantity, np.datetime64(acquired, 'D'))
+    return result
+
+
+def _file_hash(path):
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_atomic(path, write):
+    """Write via a temp file in the same directory and swap it in."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+
+
+def _save_key(key_path, key):
+    _write_atomic(key_path, lambda f: f.write(json.dumps(key).encode('utf-8')))
+
+
+def load_positions(path, snapshot_dir=None):
+    """
+    Load open positions from a broker export, using a cached snapshot.
+
+    The parsed positions are saved as a .npy file with a small key file
+    recording the export's mtime, size and hash. When the export is
+    unchanged the snapshot is memory-mapped back instead of re-parsing the
+    history. A touched but identical file is recognised by its hash.
+
+    Args:
+        path: str - transaction export
+        snapshot_dir: str - where snapshots are kept (default: next to the export)
+
+    Returns:
+        numpy structured array (read-only memmap when loaded from the snapshot)
+    """
+    base = os.path.join(snapshot_dir or os.path.dirname(os.path.abspath(path)), os.path.basename(path))
+    snapshot_path = base + SNAPSHOT_SUFFIX
+    key_path = base + KEY_SUFFIX
+
+    stat = os.stat(path)
+    key = {'version': PARSER_VERSION, 'mtime': stat.st_mtime, 'size': stat.st_size}
+
+    try:
+        with open(key_path, 'r') as f:
+            stored = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        stored = None
+
+    if stored is not None and stored.get('version') == PARSER_VERSION and os.path.exists(snapshot_path):
+        fresh = stored.get('mtime') == key['mtime'] and stored.get('size') == key['size']
+        if not fresh and stored.get('size') == key['size']:
+            key['sha1'] = _file_hash(path)
+            fresh = stored.get('sha1') == key['sha1']
+            if fresh:
+                try:
+                    _save_key(key_path, key)
+                except OSError:
+                    pass  # Only costs a re-hash next time
+        if fresh:
+            try:
+                return np.load(snapshot_path, mmap_mode='r')
+            except (OSError, ValueError) as e:
+                print(f"Warning: Could not read position snapshot: {e}")
+
+    positions = parse_transactions(path)
+    key.setdefault('sha1', _file_hash(path))
+    try:
+        _write_atomic(snapshot_path, lambda f: np.save(f, positions))
+        _save_key(key_path, key)
+    except OSError as e:
+        print(f"Warning: Could not save position snapshot: {e}")
+    return positions
@@ -0,0 +1,187 @@
+# Dividend schedule model with ex-dates and payment dates
+import math
+import time
+import datetime
+from functools import lru_cache
+from bisect import bisect_right
+from collections import namedtuple
+
+# One dividend declared by a company. amount is per share.
+DividendEvent = namedtuple('DividendEvent', ['ex_date', 'pay_date', 'amount'])
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+@lru_cache(maxsize=None)
+def date_to_timestamp(date):
+    """Epoch seconds of local midnight at the start of date."""
+    return time.mktime(datetime.datetime(date.year, date.month, date.day).timetuple())
+
+
+def year_start_timestamp(timestamp):
+    """Epoch seconds of local Jan 1 00:00 of the year containing timestamp."""
+    year = datetime.datetime.fromtimestamp(timestamp).year
+    return date_to_timestamp(datetime.date(year, 1, 1))
+
+
+class Holding:
+    """
+    A position and the dividends declared for it. The quantity is taken as
+    held for every entitled payment; a position that changed size is not
+    modelled over time, so past payments use today's quantity.
+    """
+
+    def __init__(self, name, quantity, dividends=(), acquired=None, currency="DKK"):
+        """
+        Args:
+            name: str - security name
+            quantity: float - number of shares
+            dividends: iterable of DividendEvent
+            acquired: datetime.date the shares were bought, or None if
+                      held for the whole history
+            currency: str - currency the dividends are paid in
+        """
+        self.name = name
+        self.quantity = quantity
+        self.dividends = sorted(dividends, key=lambda event: event.pay_date)
+        self.acquired = acquired
+        self.currency = currency
+
+    def is_entitled(self, event):
+        """Shares must be held before the ex-date to receive a dividend."""
+        return self.acquired is None or self.acquired < event.ex_date
+
+
+def yearly_events(ex_dates, amount, first_year, last_year, pay_delay_days=3):
+    """
+    Build events for a dividend paid on the same dates every year.
+
+    Args:
+        ex_dates: list of "MM-DD" ex-dates within a year
+        amount: float - dividend per share per payment
+        first_year, last_year: int - inclusive range of years
+        pay_delay_days: int - days from ex-date to payment
+
+    Returns:
+        list of DividendEvent
+    """
+    events = []
+    for year in range(first_year, last_year + 1):
+        for month_day in ex_dates:
+            month, day = (int(part) for part in month_day.split('-'))
+            ex_date = datetime.date(year, month, day)
+            events.append(DividendEvent(ex_date, ex_date + datetime.timedelta(days=pay_delay_days), amount))
+    return events
+
+
+class DividendSchedule:
+    """
+    Precomputed, sorted cumulative dividend schedule for a portfolio.
+
+    Two views are answered with a binary search, independent of how many
+    holdings or years of history went in:
+      - received_at(t): cash actually paid out up to t (steps on pay dates)
+      - accrued_at(t): each payment earned linearly over the period leading
+        up to it, so the value ticks continuously; it is received_at(t) plus
+        the earned share of payments still to come
+
+    Each holding counts with its current quantity from its acquired date
+    on (see Holding), so received_this_year() is only exact for positions
+    that haven't been bought into or sold from during the year.
+    """
+
+    def __init__(self, holdings, fx_rates=None):
+        """
+        Args:
+            holdings: iterable of Holding
+            fx_rates: dict currency -> rate to the display currency, applied
+                      once per holding while building (default: no conversion)
+        """
+        payments = []  # (pay timestamp, cash)
+        slope_changes = []  # (timestamp, change in accrual rate)
+
+        for holding in holdings:
+            events = [event for event in holding.dividends
+                      if holding.is_entitled(event) and event.amount and holding.quantity]
+            pay_times = [date_to_timestamp(event.pay_date) for event in events]
+            fx = fx_rates.get(holding.currency, 1.0) if fx_rates else 1.0
+            owned_from = date_to_timestamp(holding.acquired) if holding.acquired else -math.inf
+
+            for i, (event, paid_at) in enumerate(zip(events, pay_times)):
+                cash = holding.quantity * event.amount * fx
+                payments.append((paid_at, cash))
+
+                # Accrue from the previous payment of this holding; the first
+                # one uses the gap to the next payment, or a year. Nothing is
+                # earned before the shares were bought
+                if i > 0:
+                    start = pay_times[i - 1]
+                elif i + 1 < len(pay_times):
+                    start = paid_at - (pay_times[i + 1] - paid_at)
+                else:
+                    start = paid_at - 365 * SECONDS_PER_DAY
+                start = max(start, owned_from)
+                rate = cash / (paid_at - start)
+                slope_changes.append((start, rate))
+                slope_changes.append((paid_at, -rate))
+
+        payments.sort()
+        self.pay_times = [paid_at for paid_at, _ in payments]
+        self.cumulative_paid = []
+        total = 0.0
+        for _, cash in payments:
+            total += cash
+            self.cumulative_paid.append(total)
+
+        # Piecewise-linear accrual: value and slope at each breakpoint
+        slope_changes.sort()
+        self.break_times = []
+        self.break_values = []
+        self.break_slopes = []
+        value = 0.0
+        slope = 0.0
+        for at, change in slope_changes:
+            if self.break_times:
+                value += slope * (at - self.break_times[-1])
+            if self.break_times and self.break_times[-1] == at:
+                slope += change
+                self.break_slopes[-1] = slope
+                continue
+            slope += change
+            self.break_times.append(at)
+            self.break_values.append(value)
+            self.break_slopes.append(slope)
+
+    def received_at(self, timestamp):
+        """Total dividend paid out up to and including timestamp."""
+        index = bisect_right(self.pay_times, timestamp) - 1
+        return self.cumulative_paid[index] if index >= 0 else 0.0
+
+    def accrued_at(self, timestamp):
+        """Total dividend earned up to timestamp, accruing toward each payment."""
+        index = bisect_right(self.break_times, timestamp) - 1
+        if index < 0:
+            return 0.0
+        return self.break_values[index] + self.break_slopes[index] * (timestamp - self.break_times[index])
+
+    def rate_at(self, timestamp):
+        """Accrual speed at timestamp in amount per second."""
+        index = bisect_right(self.break_times, timestamp) - 1
+        return self.break_slopes[index] if index >= 0 else 0.0
+
+    def next_rate_change(self, timestamp):
+        """Seconds until the accrual speed next changes (math.inf if never)."""
+        index = bisect_right(self.break_times, timestamp)
+        return self.break_times[index] - timestamp if index < len(self.break_times) else math.inf
+
+    def received_this_year(self, timestamp=None):
+        """Dividend paid out since Jan 1 of the current year."""
+        if timestamp is None:
+            timestamp = time.time()
+        return self.received_at(timestamp) - self.received_at(year_start_timestamp(timestamp))
+
+    def accrued_this_year(self, timestamp=None):
+        """Dividend earned since Jan 1 of the current year."""
+        if timestamp is None:
+            timestamp = time.time()
+        return self.accrued_at(timestamp) - self.accrued_at(year_start_timestamp(timestamp))
@@ -0,0 +1,92 @@
+# Currency conversion for portfolio values
+import time
+import threading
+
+
+class FxRateProvider:
+    """Base class for exchange rate sources."""
+
+    name = "base"
+
+    def fetch_rates(self, base):
+        """
+        Fetch exchange rates.
+
+        Args:
+            base: str - currency everything is converted to, e.g. "DKK"
+
+        Returns:
+            dict: currency -> units of base per unit of that currency
+        """
+        raise NotImplementedError
+
+
+class StaticFxProvider(FxRateProvider):
+    """
+    Local stand-in for a real rate service, serving a fixed table of
+    approximate rates to DKK. Pass rates to use other values.
+    """
+
+    name = "static"
+
+    def __init__(self, rates=None):
+        self.rates = rates or {
+            'DKK': 1.0,
+            'EUR': 7.46,
+            'USD': 6.90,
+            'GBP': 8.70,
+            'SEK': 0.64,
+            'NOK': 0.63,
+        }
+
+    def fetch_rates(self, base):
+        base_rate = self.rates[base]
+        return {currency: rate / base_rate for currency, rate in self.rates.items()}
+
+
+class FxRateTable:
+    """
+    Cached exchange rates with a TTL. rates() hands out the same dict object
+    until the table is refreshed, so callers can tell whether anything
+    changed with an identity check instead of comparing rates.
+    """
+
+    def __init__(self, provider=None, base="DKK", ttl=3600.0):
+        """
+        Args:
+            provider: FxRateProvider (default: StaticFxProvider)
+            base: str - currency amounts are converted to
+            ttl: float - seconds before rates are fetched again
+        """
+        self.provider = provider or StaticFxProvider()
+        self.base = base
+        self.ttl = ttl
+        self._rates = None
+        self._fetched_at = None
+        self._lock = threading.Lock()
+
+    def rates(self):
+        """Current rate table, refreshed when older than the TTL."""
+        now = time.monotonic()
+        with self._lock:
+            if self._rates is None or now - self._fetched_at >= self.ttl:
+                try:
+                    self._rates = self.provider.fetch_rates(self.base)
+                except Exception as e:
+                    if self._rates is None:
+                        raise
+                    print(f"Warning: Could not refresh FX rates from {self.provider.name}: {e}")
+                self._fetched_at = now
+            return self._rates
+
+    def rate(self, currency):
+        """Units of base per unit of currency; unknown currencies count as 1.0."""
+        rate = self.rates().get(currency)
+        if rate is None:
+            print(f"Warning: No FX rate for {currency}, using 1.0")
+            return 1.0
+        return rate
+
+
+# Shared table for all widgets in the process
+fx_rates = FxRateTable()
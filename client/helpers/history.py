@@ -0,0 +1,117 @@
+# Fixed-size metric history with downsampled tiers
+from array import array
+
+# (seconds per point, points kept): 5 minutes at 1 s, 1 hour at 10 s,
+# 24 hours at 1 min. About 8 KB per metric, however long the process runs.
+DEFAULT_TIERS = ((1, 300), (10, 360), (60, 1440))
+
+# Gaps between samples up to this long are filled so every point covers
+# exactly one step; longer ones (sampling was stopped) are not
+MAX_FILL_SECONDS = 300
+
+
+class Ring:
+    """
+    Fixed-size ring with one writer and any number of readers.
+
+    The writer fills a slot before advancing the write counter, and readers
+    only look at slots below the counter, so no lock is needed: every slot a
+    reader sees holds a complete value.
+    """
+
+    def __init__(self, capacity, storage=None):
+        """
+        Args:
+            capacity: int - values kept
+            storage: preallocated sequence of capacity slots (default: a list)
+        """
+        self.capacity = capacity
+        self._slots = [None] * capacity if storage is None else storage
+        self._written = 0  # Total values ever appended
+
+    def __len__(self):
+        return min(self._written, self.capacity)
+
+    def append(self, value):
+        """Store a value, overwriting the oldest when full (writer only)."""
+        self._slots[self._written % self.capacity] = value
+        self._written += 1
+
+    def latest(self):
+        """Newest value, or None before the first append."""
+        written = self._written
+        return self._slots[(written - 1) % self.capacity] if written else None
+
+    def last(self, count=None):
+        """Up to count newest values, oldest first, as a list."""
+        written = self._written
+        available = min(written, self.capacity)
+        count = available if count is None else min(count, available)
+        start = (written - count) % self.capacity
+        end = start + count
+        if end <= self.capacity:
+            return list(self._slots[start:end])
+        return list(self._slots[start:]) + list(self._slots[:end - self.capacity])
+
+
+class RingSeries(Ring):
+    """
+    Ring of float samples backed by array('f'). The buffer is allocated
+    once and overwritten in place, so memory never grows.
+    """
+
+    def __init__(self, capacity):
+        super().__init__(capacity, array('f', bytes(4 * capacity)))
+
+
+class TieredHistory:
+    """
+    History of one metric at several resolutions. Every tier stores the
+    average of each of its time buckets once the bucket is complete, so a
+    point covers step seconds whatever the sample interval: faster samples
+    are averaged, and buckets skipped by slower ones repeat the last value.
+
+    Written by one thread (the metrics collector). Readers get copies and
+    see the newest point once the next bucket has started, which is fine
+    for display.
+    """
+
+    def __init__(self, tiers=DEFAULT_TIERS):
+        """
+        Args:
+            tiers: sequence of (seconds per point, points kept), finest first
+        """
+        self.steps = [step for step, _ in tiers]
+        self.series = {step: RingSeries(points) for step, points in tiers}
+        # Running bucket per tier: step -> [bucket number, sum, count]
+        self._buckets = {step: None for step in self.steps}
+
+    def add(self, timestamp, value):
+        """Record a sample taken at timestamp (seconds)."""
+        for step, bucket in self._buckets.items():
+            number = int(timestamp // step)
+            if bucket is None:
+                self._buckets[step] = [number, value, 1]
+            elif bucket[0] == number:
+                bucket[1] += value
+                bucket[2] += 1
+            elif number > bucket[0]:
+                # Bucket finished: store its average, repeated for any
+                # buckets the samples skipped, and start the next one
+                series = self.series[step]
+                elapsed = number - bucket[0]
+                points = elapsed if elapsed * step <= MAX_FILL_SECONDS else 1
+                average = bucket[1] / bucket[2]
+                for _ in range(min(points, series.capacity)):
+                    series.append(average)
+                self._buckets[step] = [number, value, 1]
+
+    def last(self, step, count=None):
+        """
+        Up to count newest points of the tier with this resolution.
+
+        Args:
+            step: int - seconds per point, one of the configured tiers
+            count: int - number of points (default: all kept)
+        """
+        return self.series[step].last(count)
@@ -0,0 +1,134 @@
+# Background sampling of system metrics
+import time
+from collections import namedtuple
+from helpers.history import Ring, TieredHistory
+from helpers.worker import SharedWorker
+
+# psutil is only imported once a widget starts sampling, so CLI commands
+# and widget sets without system metrics never pay for it. See load_psutil().
+psutil = None
+
+
+def load_psutil():
+    """Import psutil on first use and return the module."""
+    global psutil
+    if psutil is None:
+        import psutil as module
+        psutil = module
+    return psutil
+
+
+# One sample of the whole system. Rates are bytes per second since the
+# previous sample; they are 0.0 for the first sample or when the counters
+# are unavailable (e.g. no disks visible in a container).
+MetricsSnapshot = namedtuple('MetricsSnapshot', [
+    'timestamp', 'cpu_percent', 'cpu_per_core', 'memory_percent',
+    'disk_read_rate', 'disk_write_rate', 'net_sent_rate', 'net_recv_rate',
+])
+
+
+class MetricsCollector:
+    """
+    Samples CPU (per core), memory, disk and network I/O with psutil on a
+    daemon thread, so widgets never call into psutil from the GUI thread.
+    Widgets read latest() or history(); both return immediately.
+
+    The sampler runs while at least one widget holds it (acquire/release),
+    so nothing is sampled when no metrics widget is open.
+    """
+
+    def __init__(self, interval=1.0, history=300):
+        """
+        Args:
+            interval: float - seconds between samples
+            history: int - snapshots kept in the ring buffer
+        """
+        self.interval = interval
+        self.ring = Ring(history)
+        self.cpu_history = TieredHistory()  # 1 s / 10 s / 1 min tiers for sparklines
+        self.worker = SharedWorker(self._run, "metrics-collector")
+        self.stats = {'samples': 0, 'sample_ms': 0.0}
+
+    def configure(self, interval=None, history=None):
+        """Change sample rate and history length, e.g. from startup_config.json."""
+        if interval is not None:
+            self.interval = max(0.1, float(interval))
+        if history is not None and int(history) != self.ring.capacity:
+            ring = Ring(int(history))
+            for snapshot in self.ring.last(int(history)):
+                ring.append(snapshot)
+            self.ring = ring
+
+    def acquire(self):
+        """Register a user; starts sampling for the first one."""
+        load_psutil()
+        self.worker.acquire()
+
+    def release(self):
+        """Unregister a user; stops sampling after the last one."""
+        self.worker.release()
+
+    def latest(self):
+        """Newest snapshot, or None if nothing has been sampled yet."""
+        return self.ring.latest()
+
+    def history(self, count=None):
+        """Up to count newest snapshots, oldest first."""
+        return self.ring.last(count)
+
+    def _run(self, stop):
+        # cpu_percent(interval=None) measures since the previous call, so
+        # prime it once; the first real sample then covers one interval
+        try:
+            psutil.cpu_percent(percpu=True)
+            previous = self._read_counters()
+        except Exception as e:
+            print(f"Warning: Could not sample system metrics: {e}")
+            previous = (time.monotonic(), None, None)  # Rates start at 0.0
+        next_due = time.monotonic() + self.interval
+
+        while not stop.wait(max(0.0, next_due - time.monotonic())):
+            next_due += self.interval
+            if next_due < time.monotonic():
+                next_due = time.monotonic() + self.interval  # Fell behind; don't burst
+            try:
+                previous = self._sample(previous, stop)
+            except Exception as e:
+                print(f"Warning: Could not sample system metrics: {e}")
+
+    def _read_counters(self):
+        return time.monotonic(), psutil.disk_io_counters(), psutil.net_io_counters()
+
+    def _sample(self, previous, stop):
+        started = time.perf_counter()
+        per_core = psutil.cpu_percent(percpu=True)
+        memory = psutil.virtual_memory().percent
+        current = self._read_counters()
+
+        elapsed = current[0] - previous[0] or self.interval
+        disk, prev_disk = current[1], previous[1]
+        net, prev_net = current[2], previous[2]
+        disk_read = (disk.read_bytes - prev_disk.read_bytes) / elapsed if disk and prev_disk else 0.0
+        disk_write = (disk.write_bytes - prev_disk.write_bytes) / elapsed if disk and prev_disk else 0.0
+        net_sent = (net.bytes_sent - prev_net.bytes_sent) / elapsed if net and prev_net else 0.0
+        net_recv = (net.bytes_recv - prev_net.bytes_recv) / elapsed if net and prev_net else 0.0
+
+        if stop.is_set():
+            return current  # Released mid-sample; a new run may be writing already
+        now = time.time()
+        cpu = sum(per_core) / len(per_core) if per_core else 0.0
+        self.cpu_history.add(now, cpu)
+        self.ring.append(MetricsSnapshot(
+            now,
+            cpu,
+            tuple(per_core),
+            memory,
+            disk_read, disk_write, net_sent, net_recv,
+        ))
+        self.stats['samples'] += 1
+        self.stats['sample_ms'] = (time.perf_counter() - started) * 1000
+        return current
+
+
+# Shared collector for all metrics widgets in the process
+metrics_collector = MetricsCollector()
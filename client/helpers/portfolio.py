@@ -0,0 +1,131 @@
+# Columnar portfolio valuation
+import time
+from collections import namedtuple
+import numpy as np
+
+# Totals from one valuation pass. pnl holds the per-position result.
+Valuation = namedtuple('Valuation', ['value', 'cost', 'return_kr', 'return_pct', 'pnl'])
+
+
+class PortfolioValuation:
+    """
+    Holdings stored as parallel NumPy columns instead of a dict per
+    position. Valuing the portfolio is a handful of array operations, so the
+    cost per tick stays flat in Python overhead whether there are five
+    positions or a hundred thousand.
+
+    Prices and cost basis are per share in the position's own currency;
+    fx_rate converts that currency to kroner. Cost is converted at the
+    current rate too, so the return shown excludes currency effects.
+    """
+
+    def __init__(self, names, quantity, cost_basis, last_price=None, fx_rate=None, currencies=None):
+        """
+        Args:
+            names: list of position names (e.g. ticker symbols)
+            quantity: sequence of share counts
+            cost_basis: sequence of average purchase price per share
+            last_price: sequence of latest price per share (default: cost basis)
+            fx_rate: sequence of kroner per unit of currency (default: 1.0)
+            currencies: sequence of currency codes per position, used by
+                        set_fx_rates() (default: all DKK)
+        """
+        self.names = list(names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.quantity = np.asarray(quantity, dtype=np.float64)
+        self.cost_basis = np.asarray(cost_basis, dtype=np.float64)
+        if last_price is None:
+            self.last_price = self.cost_basis.copy()
+        else:
+            self.last_price = np.asarray(last_price, dtype=np.float64)
+        if fx_rate is None:
+            self.fx_rate = np.ones(len(self.names))
+        else:
+            self.fx_rate = np.asarray(fx_rate, dtype=np.float64)
+
+        # Each position points into a short list of distinct currencies, so
+        # new rates are applied with one gather instead of a lookup per position
+        if currencies is None:
+            currencies = ['DKK'] * len(self.names)
+        codes, index = np.unique(np.asarray(currencies, dtype='U3'), return_inverse=True)
+        self.currency_codes = codes.tolist()
+        self.currency_index = index.reshape(-1)
+
+    def __len__(self):
+        return len(self.names)
+
+    def set_prices(self, prices):
+        """
+        Update last prices.
+
+        Args:
+            prices: dict name -> price; unknown names are ignored
+        """
+        for name, price in prices.items():
+            i = self.index.get(name)
+            if i is not None:
+                self.last_price[i] = price
+
+    def set_price_array(self, rows, prices):
+        """Update last prices for row indices in bulk."""
+        self.last_price[rows] = prices
+
+    def set_fx_rates(self, rates):
+        """
+        Convert every position with a new rate table.
+
+        Args:
+            rates: dict currency -> kroner per unit; missing currencies use 1.0
+        """
+        per_currency = np.array([rates.get(code, 1.0) for code in self.currency_codes], dtype=np.float64)
+        self.fx_rate = per_currency[self.currency_index]
+
+    def value(self):
+        """
+        Value the whole portfolio in one vectorized pass.
+
+        Returns:
+            Valuation: totals in kroner and the per-position P&L array
+        """
+        shares_fx = self.quantity * self.fx_rate
+        market = shares_fx * self.last_price
+        cost = shares_fx * self.cost_basis
+        pnl = market - cost
+
+        total_value = float(market.sum())
+        total_cost = float(cost.sum())
+        return_kr = total_value - total_cost
+        return_pct = return_kr / total_cost * 100 if total_cost else 0.0
+        return Valuation(total_value, total_cost, return_kr, return_pct, pnl)
+
+
+def benchmark(positions=100_000, rounds=50):
+    """
+    Time valuation of a random portfolio.
+
+    Returns:
+        float: average milliseconds per valuation pass
+    """
+    rng = np.random.default_rng(0)
+    cost_basis = rng.uniform(5, 1000, positions)
+    portfolio = PortfolioValuation(
+        [f"POS{i}" for i in range(positions)],
+        rng.integers(1, 500, positions),
+        cost_basis,
+        cost_basis * rng.uniform(0.5, 1.5, positions),
+        currencies=rng.choice(['DKK', 'USD', 'EUR'], positions),
+    )
+    portfolio.set_fx_rates({'DKK': 1.0, 'USD': 6.9, 'EUR': 7.46})
+    portfolio.value()  # Warm up
+    start = time.perf_counter()
+    for _ in range(rounds):
+        portfolio.value()
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+if __name__ == "__main__":
+    ui_tick_ms = 1000
+    for positions in (1_000, 10_000, 100_000):
+        elapsed = benchmark(positions)
+        print(f"{positions:>7} positions: {elapsed:.3f} ms per valuation "
+              f"({elapsed / ui_tick_ms * 100:.3f}% of a {ui_tick_ms} ms tick)")
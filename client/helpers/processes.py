@@ -0,0 +1,142 @@
+# Background top-N process scanning
+import os
+import time
+import heapq
+from collections import namedtuple
+from helpers.metrics import load_psutil
+from helpers.worker import SharedWorker
+
+# One process in a scan. cpu_percent is of the whole machine (0-100).
+ProcessInfo = namedtuple('ProcessInfo', ['pid', 'name', 'cpu_percent', 'memory_rss'])
+
+# Result of one scan: the top processes by CPU and by memory
+ProcessTop = namedtuple('ProcessTop', ['timestamp', 'by_cpu', 'by_memory', 'process_count'])
+
+
+class ProcessScanner:
+    """
+    Incremental process scanner. psutil.Process objects are kept per PID
+    between scans, so the name is read once and cpu_percent() measures
+    against the previous scan without a blocking interval. Each scan only
+    creates objects for new PIDs, drops vanished ones, and reads the two
+    attributes it needs inside oneshot().
+    """
+
+    def __init__(self):
+        self.processes = {}  # pid -> (psutil.Process, name)
+        self.cpu_count = os.cpu_count() or 1
+        self.stats = {'scans': 0, 'added': 0, 'removed': 0, 'scan_ms': 0.0}
+
+    def scan(self, stop=None):
+        """
+        Sample every process once.
+
+        Args:
+            stop: threading.Event - abandon the scan early once set
+
+        Returns:
+            list of ProcessInfo (new processes report 0% CPU on their first
+            scan); partial if stopped
+        """
+        psutil = load_psutil()
+        started = time.perf_counter()
+        pids = set(psutil.pids())
+
+        for pid in self.processes.keys() - pids:
+            del self.processes[pid]
+            self.stats['removed'] += 1
+        for pid in pids - self.processes.keys():
+            try:
+                process = psutil.Process(pid)
+                self.processes[pid] = (process, process.name())
+                process.cpu_percent(None)  # Prime; measures from here
+                self.stats['added'] += 1
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+
+        results = []
+        for pid, (process, name) in list(self.processes.items()):
+            if stop is not None and stop.is_set():
+                break
+            try:
+                with process.oneshot():
+                    cpu = process.cpu_percent(None) / self.cpu_count
+                    rss = process.memory_info().rss
+            except psutil.NoSuchProcess:
+                del self.processes[pid]
+                self.stats['removed'] += 1
+                continue
+            except (psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+            results.append(ProcessInfo(pid, name, cpu, rss))
+
+        self.stats['scans'] += 1
+        self.stats['scan_ms'] = (time.perf_counter() - started) * 1000
+        return results
+
+    def top(self, count, stop=None):
+        """Scan and select the count busiest processes by CPU and by memory."""
+        processes = self.scan(stop)
+        return ProcessTop(
+            time.time(),
+            heapq.nlargest(count, processes, key=lambda p: p.cpu_percent),
+            heapq.nlargest(count, processes, key=lambda p: p.memory_rss),
+            len(processes),
+        )
+
+
+class ProcessMonitor:
+    """
+    Runs a ProcessScanner on a daemon thread and publishes the newest
+    ProcessTop as a single reference, so GUI code reads latest() without
+    locks or waiting. Scans only run while a widget holds the monitor.
+    """
+
+    def __init__(self, interval=2.0, count=10):
+        """
+        Args:
+            interval: float - seconds between scans
+            count: int - processes kept per ranking
+        """
+        self.interval = interval
+        self.count = count
+        self.scanner = ProcessScanner()  # Scanner of the current run
+        self._latest = None
+        self.worker = SharedWorker(self._run, "process-monitor")
+
+    def acquire(self, count=None):
+        """Register a user wanting at least count processes; starts scanning for the first."""
+        if count is not None:
+            self.count = max(self.count, count)
+        self.worker.acquire()
+
+    def release(self):
+        """Unregister a user; stops scanning after the last one."""
+        if self.worker.release():
+            self._latest = None  # A reopened widget waits for a fresh scan
+
+    def latest(self):
+        """Newest ProcessTop, or None before the first complete scan."""
+        return self._latest
+
+    def _run(self, stop):
+        # Each run has its own scanner, so a released run finishing its
+        # last scan never shares the per-PID cache with a new one
+        scanner = self.scanner = ProcessScanner()
+        # The first scan only primes CPU counters, so don't publish it
+        try:
+            scanner.scan(stop)
+        except Exception as e:
+            print(f"Warning: Could not scan processes: {e}")
+        while not stop.wait(self.interval):
+            try:
+                top = scanner.top(self.count, stop)
+            except Exception as e:
+                print(f"Warning: Could not scan processes: {e}")
+                continue
+            if not stop.is_set():
+                self._latest = top
+
+
+# Shared monitor for all process widgets in the process
+process_monitor = ProcessMonitor()
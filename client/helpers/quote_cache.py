@@ -0,0 +1,140 @@
+# Process-wide quote cache shared by all watchlist widgets
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+
+class QuoteCache:
+    """
+    Caches quotes per (provider, symbol) with a TTL and LRU eviction.
+
+    When several widgets ask for the same symbols, only the first caller
+    fetches them; callers arriving while that fetch is in flight wait for
+    its result instead of issuing their own request.
+    """
+
+    def __init__(self, ttl=4.0, max_entries=1024):
+        """
+        Args:
+            ttl: float - seconds a quote stays fresh
+            max_entries: int - cached quotes kept before evicting the least recently used
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (Quote, stored_at)
+        self._in_flight = {}           # key -> Future resolving to dict symbol -> Quote
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'coalesced': 0, 'evictions': 0, 'fetches': 0}
+
+    def configure(self, ttl=None, max_entries=None):
+        """Change TTL and size limits, e.g. from startup_config.json."""
+        with self._lock:
+            if ttl is not None:
+                self.ttl = float(ttl)
+            if max_entries is not None:
+                self.max_entries = int(max_entries)
+                self._evict()
+
+    def get_quotes(self, symbols, provider):
+        """
+        Return quotes for symbols, fetching only missing or stale ones.
+
+        Args:
+            symbols: list of ticker symbols
+            provider: QuoteProvider used for symbols that must be fetched
+
+        Returns:
+            dict: symbol -> Quote
+        """
+        source = provider.cache_key
+        now = time.monotonic()
+        quotes = {}
+        to_fetch = []
+        waiting = {}
+
+        with self._lock:
+            for symbol in symbols:
+                key = (source, symbol)
+                entry = self._entries.get(key)
+                if entry is not None and now - entry[1] < self.ttl:
+                    self._entries.move_to_end(key)
+                    quotes[symbol] = entry[0]
+                    self.stats['hits'] += 1
+                elif key in self._in_flight:
+                    waiting[symbol] = self._in_flight[key]
+                    self.stats['coalesced'] += 1
+                else:
+                    to_fetch.append(symbol)
+                    self.stats['misses'] += 1
+
+            if to_fetch:
+                future = Future()
+                for symbol in to_fetch:
+                    self._in_flight[(source, symbol)] = future
+                self.stats['fetches'] += 1
+
+        if to_fetch:
+            try:
+                fetched = provider.fetch_quotes(to_fetch)
+            except Exception as e:
+                future.set_exception(e)
+                raise
+            finally:
+                with self._lock:
+                    for symbol in to_fetch:
+                        self._in_flight.pop((source, symbol), None)
+            self._store(source, fetched)
+            future.set_result(fetched)
+            quotes.update(fetched)
+
+        # Symbols another caller is already fetching
+        for symbol, pending in waiting.items():
+            try:
+                quote = pending.result().get(symbol)
+            except Exception:
+                continue
+            if quote is not None:
+                quotes[symbol] = quote
+
+        return quotes
+
+    def _store(self, source, fetched):
+        now = time.monotonic()
+        with self._lock:
+            for symbol, quote in fetched.items():
+                key = (source, symbol)
+                self._entries[key] = (quote, now)
+                self._entries.move_to_end(key)
+            self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries above max_entries. Caller holds the lock."""
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats['evictions'] += 1
+
+    def hit_ratio(self):
+        """Fraction of symbol lookups answered without a new fetch."""
+        lookups = self.stats['hits'] + self.stats['misses'] + self.stats['coalesced']
+        if not lookups:
+            return 0.0
+        return (self.stats['hits'] + self.stats['coalesced']) / lookups
+
+    def summary(self):
+        """One-line description of the counters for tuning the TTL."""
+        return (f"Quote cache: {self.stats['hits']} hits, {self.stats['misses']} misses, "
+                f"{self.stats['coalesced']} coalesced, {self.stats['fetches']} fetches, "
+                f"{self.stats['evictions']} evictions, hit ratio {self.hit_ratio():.0%} "
+                f"(ttl {self.ttl}s, {len(self._entries)}/{self.max_entries} entries)")
+
+    def clear(self):
+        """Forget all cached quotes and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            for key in self.stats:
+                self.stats[key] = 0
+
+
+# Global cache instance shared by every QuoteFeed in the process
+quote_cache = QuoteCache()
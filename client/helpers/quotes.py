@@ -0,0 +1,169 @@
+# Market data feed for the watchlist widgets
+import os
+import json
+import time
+import random
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from helpers.quote_cache import quote_cache
+
+# A single price observation. change is the day's change in percent.
+Quote = namedtuple('Quote', ['symbol', 'price', 'change', 'timestamp'])
+
+
+class QuoteProvider:
+    """
+    Base class for quote sources. Providers receive every symbol for a
+    cycle in one call so remote sources can batch them into one request.
+    """
+
+    name = "base"
+
+    @property
+    def cache_key(self):
+        """Identifies this source in the shared quote cache."""
+        return self.name
+
+    def fetch_quotes(self, symbols):
+        """
+        Fetch quotes for all symbols at once.
+
+        Args:
+            symbols: list of ticker symbols
+
+        Returns:
+            dict: symbol -> Quote, omitting symbols the source doesn't know
+        """
+        raise NotImplementedError
+
+
+class SimulatedQuoteProvider(QuoteProvider):
+    """
+    Offline provider that jitters a set of base prices. Used when no real
+    source is configured.
+    """
+
+    name = "simulated"
+
+    def __init__(self, base_quotes=None):
+        self.base_quotes = base_quotes or {
+            'TSLA': {'price': 248.50, 'change': 1.2},
+            'NVDA': {'price': 875.30, 'change': -0.8},
+            'MSFT': {'price': 378.85, 'change': 0.5},
+            'AAPL': {'price': 189.25, 'change': 1.84}
+        }
+
+    def fetch_quotes(self, symbols):
+        now = time.time()
+        quotes = {}
+        for symbol in symbols:
+            base = self.base_quotes.get(symbol)
+            if base is None:
+                # Unknown symbols get a stable pseudo-random base
+                seeded = random.Random(symbol)
+                base = {'price': seeded.uniform(10, 500), 'change': seeded.uniform(-2, 2)}
+                self.base_quotes[symbol] = base
+            change_factor = 1 + (random.random() - 0.5) * 0.02  # ±1% variation
+            change = base['change'] * change_factor
+            price = base['price'] * (1 + change / 100)
+            quotes[symbol] = Quote(symbol, price, change, now)
+        return quotes
+
+
+class FileQuoteProvider(QuoteProvider):
+    """
+    Local stand-in for a real market data API. Reads a JSON file of the form
+    {"TSLA": {"price": 248.5, "change": 1.2}, ...} that any script can write,
+    and only re-parses it when the file changes.
+    """
+
+    name = "file"
+
+    def __init__(self, path):
+        self.path = path
+        self._mtime = None
+        self._data = {}
+
+    @property
+    def cache_key(self):
+        return f"file:{self.path}"
+
+    def fetch_quotes(self, symbols):
+        mtime = os.path.getmtime(self.path)
+        if mtime != self._mtime:
+            with open(self.path, 'r') as f:
+                self._data = json.load(f)
+            self._mtime = mtime
+
+        quotes = {}
+        for symbol in symbols:
+            entry = self._data.get(symbol)
+            if entry is not None:
+                quotes[symbol] = Quote(symbol, float(entry['price']), float(entry.get('change', 0.0)), mtime)
+        return quotes
+
+
+def create_provider(config=None):
+    """
+    Create a provider from a widget configuration entry.
+
+    Args:
+        config: dict like {"type": "file", "path": "quotes.json"} or None
+                for the simulated provider
+    """
+    if not config or config.get('type', 'simulated') == 'simulated':
+        return SimulatedQuoteProvider()
+    if config['type'] == 'file':
+        path = config['path']
+        if not os.path.isabs(path):
+            path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), path)
+        return FileQuoteProvider(path)
+    raise ValueError(f"Unknown quote provider type '{config['type']}'")
+
+
+class QuoteFeed:
+    """
+    Fetches quotes off the GUI thread. Each cycle sends all symbols to the
+    provider as one batch on a worker thread and hands the result to a
+    callback. A cycle is skipped while the previous one is still running,
+    so a slow source never piles up requests. Lookups go through the shared
+    quote cache, so feeds watching the same symbols share fetches.
+    """
+
+    def __init__(self, provider, max_workers=1, cache=quote_cache):
+        self.provider = provider
+        self.cache = cache
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="quote-feed")
+        self._in_flight = None
+        self._lock = threading.Lock()
+
+    def request(self, symbols, callback):
+        """
+        Start a batched fetch for symbols.
+
+        Args:
+            symbols: list of ticker symbols
+            callback: called with dict symbol -> Quote on the worker thread;
+                      GUI code must marshal it back to its own thread
+
+        Returns:
+            bool: False if the previous fetch is still running
+        """
+        with self._lock:
+            if self._in_flight is not None and not self._in_flight.done():
+                return False
+            self._in_flight = self.executor.submit(self._fetch, list(symbols), callback)
+        return True
+
+    def _fetch(self, symbols, callback):
+        try:
+            quotes = self.cache.get_quotes(symbols, self.provider)
+        except Exception as e:
+            print(f"Warning: Could not fetch quotes from {self.provider.name}: {e}")
+            return
+        callback(quotes)
+
+    def shutdown(self):
+        """Stop the worker thread without waiting for a running fetch."""
+        self.executor.shutdown(wait=False)
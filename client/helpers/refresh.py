@@ -0,0 +1,205 @@
+# Adaptive refresh policy for widget updates
+import sys
+import math
+import time
+import datetime
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # Python < 3.9
+    ZoneInfo = None
+
+# Standard-time UTC offsets (hours) of common exchange time zones, used
+# when the IANA database is missing (Windows without the tzdata package).
+# Daylight saving time is not applied, so sessions may be an hour off in summer.
+FALLBACK_UTC_OFFSETS = {
+    'America/New_York': -5,
+    'America/Chicago': -6,
+    'America/Toronto': -5,
+    'Europe/London': 0,
+    'Europe/Copenhagen': 1,
+    'Europe/Stockholm': 1,
+    'Europe/Oslo': 1,
+    'Europe/Berlin': 1,
+    'Europe/Paris': 1,
+    'Europe/Amsterdam': 1,
+    'Europe/Zurich': 1,
+    'Europe/Helsinki': 2,
+    'Asia/Tokyo': 9,
+    'Asia/Hong_Kong': 8,
+    'Australia/Sydney': 10,
+}
+
+
+def resolve_timezone(name, utc_offset=None):
+    """
+    Look up a time zone, falling back to a fixed UTC offset without tz data.
+
+    Args:
+        name: str - IANA name like "America/New_York"
+        utc_offset: float - hours to use when name can't be resolved
+                    (default: FALLBACK_UTC_OFFSETS)
+
+    Returns:
+        tzinfo, or None for local time
+    """
+    try:
+        return ZoneInfo(name)
+    except Exception:
+        pass
+    if utc_offset is None:
+        utc_offset = FALLBACK_UTC_OFFSETS.get(name)
+    if utc_offset is None:
+        print(f"Warning: Unknown timezone '{name}', using local time (install tzdata or set utc_offset)")
+        return None
+    print(f"Warning: No tz data for '{name}', using UTC{utc_offset:+g} without daylight saving (install tzdata)")
+    return datetime.timezone(datetime.timedelta(hours=utc_offset), name)
+
+
+def user_idle_seconds():
+    """
+    Seconds since the last keyboard or mouse input (Windows). A locked
+    session counts as idle. Returns 0.0 where this can't be measured.
+    """
+    if sys.platform != 'win32':
+        return 0.0
+    import ctypes
+    from ctypes import wintypes
+
+    class LASTINPUTINFO(ctypes.Structure):
+        _fields_ = [('cbSize', wintypes.UINT), ('dwTime', wintypes.DWORD)]
+
+    info = LASTINPUTINFO()
+    info.cbSize = ctypes.sizeof(info)
+    if not ctypes.windll.user32.GetLastInputInfo(ctypes.byref(info)):
+        return 0.0
+    # Both tick counts wrap together every ~49.7 days
+    elapsed_ms = (ctypes.windll.kernel32.GetTickCount() - info.dwTime) & 0xFFFFFFFF
+    return elapsed_ms / 1000
+
+
+def seconds_until_display_change(value, rate, decimals):
+    """
+    Time until a value moving at rate per second shows a different
+    number when rounded to decimals.
+
+    Returns:
+        float: seconds, or math.inf if the value is not moving
+    """
+    if rate == 0:
+        return math.inf
+    step = 10 ** -decimals
+    shown = round(value / step)
+    # Rounding flips half a step past the shown value, in the direction of travel
+    boundary = (shown + (0.5 if rate > 0 else -0.5)) * step
+    return max(0.0, (boundary - value) / rate)
+
+
+class MarketHours:
+    """
+    Regular trading session of an exchange, e.g. 09:30-16:00 New York time
+    on weekdays. Holidays are not modelled.
+    """
+
+    def __init__(self, open="09:00", close="17:00", timezone=None, weekdays=(0, 1, 2, 3, 4), utc_offset=None):
+        """
+        Args:
+            open, close: str - "HH:MM" session start and end
+            timezone: str - IANA name like "America/New_York" (default: local time)
+            weekdays: iterable of trading days, Monday = 0
+            utc_offset: float - hours from UTC if timezone can't be resolved
+        """
+        self.open = datetime.time(*map(int, open.split(':')))
+        self.close = datetime.time(*map(int, close.split(':')))
+        self.weekdays = set(weekdays)
+        self.tz = resolve_timezone(timezone, utc_offset) if timezone else None
+
+    @classmethod
+    def from_config(cls, config):
+        """Create from a config dict like {"open": "09:30", "close": "16:00", "timezone": "America/New_York"}."""
+        if not config:
+            return None
+        return cls(config.get('open', "09:00"), config.get('close', "17:00"),
+                   config.get('timezone'), config.get('weekdays', (0, 1, 2, 3, 4)),
+                   config.get('utc_offset'))
+
+    def _now(self, timestamp):
+        return datetime.datetime.fromtimestamp(timestamp, self.tz)
+
+    def is_open(self, timestamp=None):
+        """True during the trading session."""
+        now = self._now(time.time() if timestamp is None else timestamp)
+        return now.weekday() in self.weekdays and self.open <= now.time() < self.close
+
+    def seconds_until_open(self, timestamp=None):
+        """Seconds until the next session starts (0 while open)."""
+        timestamp = time.time() if timestamp is None else timestamp
+        if self.is_open(timestamp):
+            return 0.0
+        now = self._now(timestamp)
+        for days in range(8):
+            day = now.date() + datetime.timedelta(days=days)
+            start = datetime.datetime.combine(day, self.open, now.tzinfo)
+            if day.weekday() in self.weekdays and start > now:
+                return start.timestamp() - timestamp
+        return math.inf
+
+
+class RefreshPolicy:
+    """
+    Works out when a widget's next update is actually useful. A widget
+    still ticks at its base interval while someone is looking and the data
+    is moving, but backs off when:
+      - its window is hidden or minimized
+      - the user has been idle (or the session is locked) for a while
+      - its market is closed
+      - the shown digits won't change before a later time
+    The result is handed to the scheduler's defer(), so skipped ticks
+    cost no wake-up at all.
+    """
+
+    def __init__(self, base_ms, hidden_ms=30000, idle_after=300, idle_ms=60000, max_ms=300000):
+        """
+        Args:
+            base_ms: int - normal update interval
+            hidden_ms: int - interval while the window isn't visible
+            idle_after: float - seconds without input before backing off
+            idle_ms: int - interval while the user is idle
+            max_ms: int - longest delay ever returned, so widgets recover
+                      from clock changes or missed events
+        """
+        self.base_ms = base_ms
+        self.hidden_ms = hidden_ms
+        self.idle_after = idle_after
+        self.idle_ms = idle_ms
+        self.max_ms = max_ms
+        self.stats = {'decisions': 0, 'backed_off': 0}
+
+    def delay_ms(self, visible=True, market=None, change_in=None, idle_seconds=None):
+        """
+        Milliseconds until the next useful update.
+
+        Args:
+            visible: bool - whether the widget can currently be seen
+            market: MarketHours the data depends on, or None
+            change_in: float - seconds until the shown value changes
+                       (math.inf if it won't), or None if unknown
+            idle_seconds: float - override for user_idle_seconds()
+        """
+        delay = self.base_ms
+        if not visible:
+            delay = max(delay, self.hidden_ms)
+        if idle_seconds is None:
+            idle_seconds = user_idle_seconds()
+        if idle_seconds >= self.idle_after:
+            delay = max(delay, self.idle_ms)
+        if market is not None:
+            delay = max(delay, market.seconds_until_open() * 1000)
+        if change_in is not None:
+            delay = max(delay, change_in * 1000)
+
+        delay = int(min(delay, self.max_ms))
+        self.stats['decisions'] += 1
+        if delay > self.base_ms:
+            self.stats['backed_off'] += 1
+        return delay
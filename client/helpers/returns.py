@@ -0,0 +1,104 @@
+# Incrementally maintained portfolio returns
+
+class ReturnsEngine:
+    """
+    Keeps total value and return of a PortfolioValuation current as prices
+    stream in. A price update only recomputes that position's market value
+    and adds the difference to the totals, so each quote costs O(1) no
+    matter how many positions the portfolio holds.
+
+    Adding many deltas slowly accumulates floating point error, so the
+    totals are rebuilt from a full vectorized valuation every
+    resync_every updates (and whenever resync() is called).
+    """
+
+    def __init__(self, valuation, resync_every=10000):
+        """
+        Args:
+            valuation: PortfolioValuation holding the positions and prices
+            resync_every: int - price updates between full revaluations
+        """
+        self.valuation = valuation
+        self.resync_every = resync_every
+        self.stats = {'updates': 0, 'unchanged': 0, 'resyncs': 0}
+        self.resync()
+
+    def resync(self):
+        """Rebuild every total from a full valuation pass."""
+        v = self.valuation
+        shares_fx = v.quantity * v.fx_rate
+        # Plain lists: scalar access is much cheaper than indexing NumPy arrays
+        self._shares_fx = shares_fx.tolist()
+        self._prices = v.last_price.tolist()
+        self.position_value = (shares_fx * v.last_price).tolist()
+        self.position_cost = (shares_fx * v.cost_basis).tolist()
+
+        totals = v.value()
+        self.total_value = totals.value
+        self.total_cost = totals.cost
+        self._since_resync = 0
+        self.stats['resyncs'] += 1
+
+    def set_fx_rates(self, rates):
+        """Apply a new FX rate table; every position changes, so resync."""
+        self.valuation.set_fx_rates(rates)
+        self.resync()
+
+    def update_price(self, name, price):
+        """
+        Apply a new price for one position.
+
+        Returns:
+            bool: True if the totals changed
+        """
+        i = self.valuation.index.get(name)
+        if i is None:
+            return False
+        old = self._prices[i]
+        if price == old:
+            self.stats['unchanged'] += 1
+            return False
+
+        delta = self._shares_fx[i] * (price - old)
+        self._prices[i] = price
+        self.valuation.last_price[i] = price
+        self.position_value[i] += delta
+        self.total_value += delta
+        self.stats['updates'] += 1
+
+        self._since_resync += 1
+        if self._since_resync >= self.resync_every:
+            self.resync()
+        return True
+
+    def apply_quotes(self, quotes):
+        """
+        Apply a batch of quotes.
+
+        Args:
+            quotes: dict symbol -> Quote (or -> price)
+
+        Returns:
+            int: number of positions whose price changed
+        """
+        changed = 0
+        for symbol, quote in quotes.items():
+            price = getattr(quote, 'price', quote)
+            if self.update_price(symbol, price):
+                changed += 1
+        return changed
+
+    def position_pnl(self, name):
+        """Profit/loss in kroner of one position."""
+        i = self.valuation.index[name]
+        return self.position_value[i] - self.position_cost[i]
+
+    @property
+    def return_kr(self):
+        """Total return in kroner."""
+        return self.total_value - self.total_cost
+
+    @property
+    def return_pct(self):
+        """Total return in percent of the cost basis."""
+        return self.return_kr / self.total_cost * 100 if self.total_cost else 0.0
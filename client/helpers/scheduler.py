@@ -0,0 +1,134 @@
+# Shared scheduler for periodic widget updates
+import math
+import time
+import itertools
+
+# Jobs due within this many milliseconds of a wake-up run in that wake-up
+# instead of arming another timer. Also absorbs timers firing a bit early.
+DEFAULT_BATCH_WINDOW = 20
+
+
+class TickScheduler:
+    """
+    Runs any number of periodic callbacks from a single timer. Instead of
+    every widget owning its own after()/QTimer, widgets register jobs here
+    and the scheduler arms one timer for the earliest due job.
+
+    Aligned jobs fire on wall-clock multiples of their interval (a 1 s job
+    on whole seconds, a 5 s job on :00, :05, ...), so widgets with related
+    intervals share wake-ups instead of waking the CPU at random phases.
+    Every job due within the batch window of a wake-up runs in it.
+    """
+
+    def __init__(self, call_later, cancel_call, batch_window=DEFAULT_BATCH_WINDOW, clock=time.time):
+        """
+        Args:
+            call_later: function(delay_ms, callback) -> handle, e.g. root.after
+            cancel_call: function(handle), e.g. root.after_cancel
+            batch_window: int - ms a job may run early to share a wake-up
+            clock: function returning wall-clock seconds
+        """
+        self.call_later = call_later
+        self.cancel_call = cancel_call
+        self.batch_window = batch_window
+        self.clock = clock
+        self.jobs = {}  # job id -> {'interval': ms, 'align': bool, 'due': seconds, 'callback': fn}
+        self._ids = itertools.count(1)
+        self._timer = None
+        self._timer_due = None
+        self.stats = {'wakeups': 0, 'callbacks': 0}
+
+    def every(self, interval_ms, callback, run_now=False, align=True):
+        """
+        Call callback every interval_ms milliseconds.
+
+        Args:
+            interval_ms: int - period in milliseconds
+            callback: function taking no arguments
+            run_now: bool - also call it once immediately
+            align: bool - fire on wall-clock multiples of the interval
+
+        Returns:
+            int: job id for cancel()
+        """
+        job_id = next(self._ids)
+        job = {'interval': interval_ms, 'align': align, 'callback': callback}
+        job['due'] = self._next_due(job, self.clock())
+        self.jobs[job_id] = job
+        if run_now:
+            callback()
+        self._arm()
+        return job_id
+
+    def set_interval(self, job_id, interval_ms):
+        """Change a job's period; takes effect from its next run."""
+        job = self.jobs.get(job_id)
+        if job is None or job['interval'] == interval_ms:
+            return
+        job['interval'] = interval_ms
+        job['due'] = self._next_due(job, self.clock())
+        self._arm(force=True)
+
+    def defer(self, job_id, delay_ms):
+        """
+        Move a job's next run to the first aligned tick at least delay_ms
+        from now; it then continues at its normal period. A delay shorter
+        than the period brings a deferred job back to its next regular tick.
+        Unknown ids are ignored.
+        """
+        job = self.jobs.get(job_id)
+        if job is None:
+            return
+        now = self.clock()
+        if delay_ms > job['interval']:
+            # _next_due is strictly after its argument, so back off a hair
+            job['due'] = self._next_due(job, now + delay_ms / 1000 - 1e-6)
+        else:
+            job['due'] = min(job['due'], self._next_due(job, now))
+        if self._timer is not None:
+            # Re-arm if the earliest run moved either way
+            self._arm(force=self._timer_due != min(j['due'] for j in self.jobs.values()))
+
+    def cancel(self, job_id):
+        """Stop a job. Unknown ids are ignored."""
+        self.jobs.pop(job_id, None)
+
+    def _next_due(self, job, now):
+        """First run time strictly after now."""
+        period = job['interval'] / 1000
+        if job['align']:
+            # Epsilon keeps a job run exactly on its boundary from landing on it again
+            return (math.floor(now / period + 1e-9) + 1) * period
+        return now + period
+
+    def _arm(self, force=False):
+        """Make sure the single timer fires for the earliest due job."""
+        if not self.jobs:
+            return
+        due = min(job['due'] for job in self.jobs.values())
+        if self._timer is not None:
+            if self._timer_due <= due and not force:
+                return
+            self.cancel_call(self._timer)
+        delay_ms = max(0, math.ceil((due - self.clock()) * 1000))
+        self._timer = self.call_later(delay_ms, self._wake)
+        self._timer_due = due
+
+    def _wake(self):
+        """Run every job due within the batch window, then re-arm."""
+        self._timer = None
+        self.stats['wakeups'] += 1
+        now = self.clock()
+        horizon = now + self.batch_window / 1000
+        for job_id, job in list(self.jobs.items()):
+            if job['due'] > horizon or job_id not in self.jobs:
+                continue
+            # Next run comes from the clock, so missed periods (sleep,
+            # stalls) are skipped instead of replayed
+            job['due'] = self._next_due(job, max(now, job['due']))
+            self.stats['callbacks'] += 1
+            try:
+                job['callback']()
+            except Exception as e:
+                print(f"Warning: Scheduled update failed: {e}")
+        self._arm()
@@ -0,0 +1,92 @@
+# Single-process host for the Tk widgets
+import tkinter as tk
+from helpers.scheduler import TickScheduler
+from helpers.tk_render import TkRenderer
+from helpers.animation import FrameClock
+
+
+class TkWidgetHost:
+    """
+    Hosts many Tk widgets in one interpreter. The Tk root stays hidden and
+    every widget lives in its own Toplevel, with all periodic updates driven
+    by one shared scheduler, so N widgets cost one interpreter and one
+    event loop instead of N.
+    """
+
+    def __init__(self, fps=0):
+        """
+        Create the hidden root window and the shared scheduler.
+
+        Args:
+            fps: int - frame rate for animated widgets, 0 to update them
+                 on their normal ticks only
+        """
+        self.root = tk.Tk()
+        self.root.withdraw()
+        self.scheduler = TickScheduler(self.root.after, self.root.after_cancel)
+        self.renderer = TkRenderer()  # Shared label dirty-tracking for all widgets
+        # One frame timer for all animations; None when animation is off
+        self.frame_clock = FrameClock(self.root.after, self.root.after_cancel, fps) if fps > 0 else None
+        self.windows = []
+
+    def new_window(self):
+        """
+        Create a Toplevel for a widget. The host exits when the last
+        widget window is destroyed.
+
+        Returns:
+            tk.Toplevel: the new window
+        """
+        window = tk.Toplevel(self.root)
+        self.windows.append(window)
+        window.bind("<Destroy>", lambda event, w=window: self._on_destroy(event, w))
+        return window
+
+    def _on_destroy(self, event, window):
+        # <Destroy> is also delivered for child widgets; only react to the window itself
+        if event.widget is not window:
+            return
+        if window in self.windows:
+            self.windows.remove(window)
+        if not self.windows:
+            self.root.quit()
+
+    def every(self, interval_ms, callback, run_now=False):
+        """Register a periodic update with the shared scheduler."""
+        return self.scheduler.every(interval_ms, callback, run_now)
+
+    def defer(self, job_id, delay_ms):
+        """Skip a periodic update's runs for at least delay_ms."""
+        self.scheduler.defer(job_id, delay_ms)
+
+    def cancel(self, job_id):
+        """Cancel a periodic update."""
+        self.scheduler.cancel(job_id)
+
+    def add(self, widget_class):
+        """
+        Create a widget in a new window and start its updates.
+
+        Args:
+            widget_class: class taking (window, host) with an update_interval
+                          attribute and an opdater() method
+
+        Returns:
+            The widget instance; its tick_job can be passed to defer()
+        """
+        window = self.new_window()
+        widget = widget_class(window, self)
+        widget.tick_job = None  # Not registered yet during the first opdater()
+        widget.tick_job = self.every(widget_class.update_interval, widget.opdater, run_now=True)
+        return widget
+
+    def run(self):
+        """Run the shared event loop until all widget windows are closed."""
+        self.root.mainloop()
+        try:
+            self.root.destroy()
+        except tk.TclError:
+            pass
+        print(self.renderer.summary())
+        if self.frame_clock:
+            print(self.frame_clock.summary())
@@ -0,0 +1,104 @@
+# Dirty-tracking render layer for Tk widgets
+import tkinter.font as tkfont
+
+_MISSING = object()
+
+
+class TkRenderer:
+    """
+    Remembers the last value rendered per target and only calls into Tk
+    when it changes. Widgets format their text once per tick and hand it
+    here; unchanged text (censored mode, a portfolio without dividends,
+    a value that moved below the shown precision) costs a dict lookup
+    instead of a config() round trip through the Tcl interpreter.
+    """
+
+    def __init__(self):
+        self.rendered = {}  # target -> last value applied
+        self.stats = {'applied': 0, 'skipped': 0}
+
+    def set(self, target, value, apply):
+        """
+        Apply value to target unless it is already showing it.
+
+        Args:
+            target: hashable key, usually the Tk widget itself
+            value: new value
+            apply: function(value) performing the Tk update
+
+        Returns:
+            bool: True if apply was called
+        """
+        if self.rendered.get(target, _MISSING) == value:
+            self.stats['skipped'] += 1
+            return False
+        apply(value)
+        self.rendered[target] = value
+        self.stats['applied'] += 1
+        return True
+
+    def set_text(self, label, text):
+        """Set a Label's text if it changed."""
+        return self.set(label, text, lambda value: label.config(text=value))
+
+    def forget(self, target):
+        """Drop the cached value, e.g. when the widget is destroyed."""
+        self.rendered.pop(target, None)
+
+    def summary(self):
+        """One-line applied/skipped report."""
+        total = self.stats['applied'] + self.stats['skipped']
+        skipped = self.stats['skipped'] / total * 100 if total else 0.0
+        return f"Tk redraws: {self.stats['applied']} applied, {self.stats['skipped']} skipped ({skipped:.0f}% skipped)"
+
+
+class GlyphText:
+    """
+    Single-line text drawn on a Canvas as one text item per character
+    cell. Setting new text only reconfigures the cells whose character
+    changed, so a ticking counter redraws the one or two digits that moved
+    instead of re-laying out the whole string like a Label does.
+    """
+
+    def __init__(self, canvas, x, y, font, fill):
+        """
+        Args:
+            canvas: tk.Canvas to draw on
+            x, y: int - centre of the text
+            font: Tk font description, ideally monospaced
+            fill: str - text colour
+        """
+        self.canvas = canvas
+        self.x = x
+        self.y = y
+        self.font = tkfont.Font(root=canvas, font=font)
+        if not self.font.metrics('fixed'):
+            # Cells need equal widths; fall back to Tk's own monospace font
+            self.font = tkfont.nametofont('TkFixedFont', root=canvas).copy()
+            self.font.configure(size=tkfont.Font(root=canvas, font=font).actual('size'))
+        self.fill = fill
+        self.cell = self.font.measure('0')
+        self.items = []  # One canvas text item per character cell
+        self.chars = []  # Character currently shown in each cell
+        self.stats = {'glyphs': 0}
+
+    def set(self, text):
+        """Show text, touching only the cells that changed."""
+        if len(text) != len(self.chars):
+            self._layout(len(text))
+        for index, char in enumerate(text):
+            if self.chars[index] != char:
+                self.canvas.itemconfigure(self.items[index], text=char)
+                self.chars[index] = char
+                self.stats['glyphs'] += 1
+
+    def _layout(self, length):
+        """Create or hide cells and centre them for text of length characters."""
+        while len(self.items) < length:
+            self.items.append(self.canvas.create_text(0, self.y, anchor='w', text='', font=self.font, fill=self.fill))
+        left = self.x - length * self.cell / 2
+        for index, item in enumerate(self.items):
+            self.canvas.coords(item, left + index * self.cell, self.y)
+            if index >= length:
+                self.canvas.itemconfigure(item, text='')
+        self.chars = [''] * length
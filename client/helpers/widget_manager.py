@@ -1,6 +1,7 @@
 # Widget manager for handling multiple widgets
 import tkinter as tk
 from helpers.desktop_widget import DesktopWidget
+from helpers.tk_host import TkWidgetHost
 from ui.widget_ui import WidgetUI
 from ui.menu_handler import MenuHandler
 from config.settings import UI_CONFIG
@@ -10,8 +11,14 @@ class WidgetManager:
     Manages multiple widgets and their calculators.
     """
     
-    def __init__(self):
-        """Initialize the widget manager."""
+    def __init__(self, host=None):
+        """
+        Initialize the widget manager.
+        
+        Args:
+            host: TkWidgetHost - shared Tk interpreter and scheduler; created if omitted
+        """
+        self.host = host or TkWidgetHost()
         self.widgets = {}
         self.next_widget_id = 1
         
@@ -29,8 +36,8 @@ class WidgetManager:
         widget_id = f"widget_{self.next_widget_id}"
         self.next_widget_id += 1
         
-        # Create new window
-        root = tk.Tk()
+        # Create new window in the shared interpreter
+        root = self.host.new_window()
         
         # Create UI components
         ui = WidgetUI(root)
@@ -53,7 +60,8 @@ class WidgetManager:
             'ui': ui,
             'menu_handler': menu_handler,
             'desktop_widget': desktop_widget,
-            'is_running': False
+            'is_running': False,
+            'job_id': None
         }
         
         self.widgets[widget_id] = widget_info
@@ -118,10 +126,14 @@ class WidgetManager:
             return
             
         widget_info['is_running'] = True
-        self._update_widget(widget_id)
+        widget_info['job_id'] = self.host.every(
+            UI_CONFIG['update_interval'],
+            lambda: self._update_widget(widget_id),
+            run_now=True
+        )
         
     def _update_widget(self, widget_id):
-        """Update a specific widget."""
+        """Update a specific widget (called by the shared scheduler)."""
         if widget_id not in self.widgets:
             return
             
@@ -136,12 +148,9 @@ class WidgetManager:
             # Update calculator
             calculator.calculate_current_value()
             
-            # Update display
+            # Update display only when the text changed
             display_text = calculator.get_display_text()
-            ui.update_display(display_text)
-            
-            # Schedule next update
-            widget_info['root'].after(UI_CONFIG['update_interval'], lambda: self._update_widget(widget_id))
+            self.host.renderer.set(ui, display_text, ui.update_display)
             
         except tk.TclError:
             # Widget was closed
@@ -150,7 +159,11 @@ class WidgetManager:
     def stop_widget(self, widget_id):
         """Stop the update loop for a widget."""
         if widget_id in self.widgets:
-            self.widgets[widget_id]['is_running'] = False
+            widget_info = self.widgets[widget_id]
+            widget_info['is_running'] = False
+            if widget_info['job_id'] is not None:
+                self.host.cancel(widget_info['job_id'])
+                widget_info['job_id'] = None
             
     def reset_widget(self, widget_id):
         """Reset a widget's calculator."""
@@ -181,13 +194,14 @@ class WidgetManager:
         """Close a specific widget."""
         if widget_id in self.widgets:
             widget_info = self.widgets[widget_id]
-            widget_info['is_running'] = False
+            self.stop_widget(widget_id)
             
             try:
                 widget_info['root'].destroy()
             except:
                 pass
                 
+            self.host.renderer.forget(widget_info['ui'])
             del self.widgets[widget_id]
             
     def close_all_widgets(self):
@@ -228,7 +242,7 @@ class WidgetManager:
                 message += f"  Status: {status}\n\n"
         
         # Create info window
-        info_window = tk.Toplevel()
+        info_window = tk.Toplevel(self.host.root)
         info_window.title("Widget Manager")
         info_window.geometry("400x300")
         
@@ -0,0 +1,52 @@
+# Reference-counted background threads
+import threading
+
+
+class SharedWorker:
+    """
+    A daemon thread that runs while at least one user holds it. The first
+    acquire() starts target(stop) with a fresh threading.Event and the last
+    release() sets it.
+
+    Released threads are never joined, so the GUI thread doesn't wait for
+    a pass to finish. A new run may therefore start while the old one is
+    finishing: targets keep per-run state local and check stop before
+    publishing anything.
+    """
+
+    def __init__(self, target, name):
+        """
+        Args:
+            target: function(stop) run on the thread until stop is set
+            name: str - thread name
+        """
+        self.target = target
+        self.name = name
+        self._users = 0
+        self._lock = threading.Lock()  # Guards start/stop only
+        self._stop = None  # Event of the current run, None when stopped
+
+    def acquire(self):
+        """Register a user; starts a run for the first one. Returns True if it started."""
+        with self._lock:
+            self._users += 1
+            if self._stop is not None:
+                return False
+            self._stop = threading.Event()
+            threading.Thread(target=self.target, args=(self._stop,), name=self.name, daemon=True).start()
+            return True
+
+    def release(self):
+        """Unregister a user; stops the run after the last one. Returns True if it stopped."""
+        with self._lock:
+            self._users = max(0, self._users - 1)
+            if self._users or self._stop is None:
+                return False
+            self._stop.set()
+            self._stop = None
+            return True
+
+    @property
+    def running(self):
+        """True while a run is active."""
+        return self._stop is not None
@@ -0,0 +1,99 @@
+import os
+import datetime
+from helpers.broker_import import load_positions
+from helpers.dividends import Holding, DividendSchedule, yearly_events
+from helpers.portfolio import PortfolioValuation
+from helpers.quotes import SimulatedQuoteProvider, create_provider
+from helpers.fx import fx_rates
+
+#Aktiedata
+# udbytte er pr. aktie pr. udbetaling, ex_datoer er "MM-DD" hvert år.
+# kostpris, kurs og udbytte er i aktiens valuta; kostpris er gennemsnitlig
+# købspris pr. aktie, kurs er seneste kendte kurs.
+# Valgfrit: "købt": datetime.date - udbytte med ex-dato før købet tæller ikke med
+aktier = {
+    "Novo Nordisk":     {"symbol": "NOVO-B.CO", "valuta": "DKK", "antal": 7,  "kostpris": 520.0, "kurs": 410.0,  "udbytte": 6.0,   "ex_datoer": ["03-28", "08-15"]},   # 6 kr x 2 per år = 12 kr/aktie/år
+    "Simon Property":   {"symbol": "SPG",       "valuta": "USD", "antal": 2,  "kostpris": 140.0, "kurs": 175.0,  "udbytte": 7.6,   "ex_datoer": ["03-10", "06-09", "09-09", "12-09"]},
+    "Tesla":            {"symbol": "TSLA",      "valuta": "USD", "antal": 66, "kostpris": 210.0, "kurs": 248.5,  "udbytte": 0.0,   "ex_datoer": []},
+    "thyssenkrupp AG":  {"symbol": "TKA.DE",    "valuta": "EUR", "antal": 29, "kostpris": 4.2,   "kurs": 6.8,    "udbytte": 0.15,  "ex_datoer": ["02-03"]},
+    "Vestjysk Bank":    {"symbol": "VJBA.CO",   "valuta": "DKK", "antal": 28, "kostpris": 3.6,   "kurs": 4.3,    "udbytte": 0.20,  "ex_datoer": ["04-01"]}
+}
+
+# Transaktionseksport fra banken. Findes filen, bruges dens beholdning
+# (antal, kostpris, købsdato) i stedet for tallene ovenfor; aktier bruges
+# stadig til kurs og udbyttedatoer for de symboler der står i den.
+eksport_fil = os.path.join(os.path.dirname(os.path.abspath(__file__)), "portefolje.csv")
+
+#Indlæs beholdning fra eksportfilen, hvis den findes
+def indlæs_aktier():
+    if not os.path.exists(eksport_fil):
+        return aktier
+    try:
+        positioner = load_positions(eksport_fil)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not import {eksport_fil}: {e}")
+        return aktier
+
+    efter_symbol = {aktie["symbol"]: (navn, aktie) for navn, aktie in aktier.items()}
+    indlæst = {}
+    for position in positioner:
+        symbol = str(position["symbol"])
+        navn, kendt = efter_symbol.get(symbol, (symbol, {}))
+        indlæst[navn] = {
+            "symbol": symbol,
+            "valuta": str(position["currency"]),
+            "antal": float(position["quantity"]),
+            "kostpris": float(position["cost_basis"]),
+            "kurs": kendt.get("kurs", float(position["cost_basis"])),
+            "udbytte": kendt.get("udbytte", 0.0),
+            "ex_datoer": kendt.get("ex_datoer", []),
+            "købt": position["acquired"].item(),
+        }
+    return indlæst
+
+# Kilde til live kurser, fx {"type": "file", "path": "quotes.json"}.
+# None simulerer kurser omkring "kurs" for hver aktie.
+kurs_kilde = None
+
+# Handelstid for kurserne; uden for den hentes der ikke kurser.
+# Dækker Københavns og New Yorks åbningstid set fra Danmark.
+markedstider = {"open": "09:00", "close": "22:00", "timezone": "Europe/Copenhagen"}
+
+# Udbyttehistorik genereres fra første_år til og med næste år
+første_år = 2015
+betaling_dage = 3  # Dage fra ex-dato til udbetaling
+
+#Byg beholdning og udbyttekalender
+def byg_beholdning(sidste_år=None):
+    if sidste_år is None:
+        sidste_år = datetime.date.today().year + 1
+    beholdning = []
+    for navn, aktie in indlæs_aktier().items():
+        udbytter = yearly_events(aktie["ex_datoer"], aktie["udbytte"], første_år, sidste_år, betaling_dage)
+        beholdning.append(Holding(navn, aktie["antal"], udbytter, acquired=aktie.get("købt"), currency=aktie["valuta"]))
+    return beholdning
+
+def byg_udbyttekalender(kurser=None):
+    return DividendSchedule(byg_beholdning(), kurser or fx_rates.rates())
+
+#Byg værdiansættelse af beholdningen (kolonner pr. symbol, omregnet til kr)
+def byg_værdiansættelse(kurser=None):
+    valgte = list(indlæs_aktier().values())
+    værdiansættelse = PortfolioValuation(
+        [aktie["symbol"] for aktie in valgte],
+        [aktie["antal"] for aktie in valgte],
+        [aktie["kostpris"] for aktie in valgte],
+        [aktie["kurs"] for aktie in valgte],
+        currencies=[aktie["valuta"] for aktie in valgte],
+    )
+    værdiansættelse.set_fx_rates(kurser or fx_rates.rates())
+    return værdiansættelse
+
+#Opret kilden til live kurser
+def opret_kurs_kilde():
+    if kurs_kilde is not None:
+        return create_provider(kurs_kilde)
+    return SimulatedQuoteProvider({
+        aktie["symbol"]: {"price": aktie["kurs"], "change": 0.5}
+        for aktie in indlæs_aktier().values()
+    })
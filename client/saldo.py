@@ -1,118 +1,179 @@
 import tkinter as tk
+import math
 import time
-import datetime
 from helpers.desktop_widget import DesktopWidget
-
-#Aktiedata
-aktier = {
-    "Novo Nordisk":     {"antal": 7,  "udbytte": 6.0,   "frekvens": 2},   # 6 kr x 2 per år = 12 kr/aktie/år
-    "Simon Property":   {"antal": 2,  "udbytte": 7.6,   "frekvens": 4},
-    "Tesla":            {"antal": 66, "udbytte": 0.0,   "frekvens": 0},
-    "thyssenkrupp AG":  {"antal": 29, "udbytte": 0.15,  "frekvens": 1},
-    "Vestjysk Bank":    {"antal": 28, "udbytte": 0.20,  "frekvens": 1}
-}
-
-SEKUNDERPRÅR = 365 * 24 * 60 * 60
-
-#Beregn årligt og pr. sekund
-def beregn_årligt_udbytte():
-    samlet = 0
-    for aktie in aktier.values():
-        samlet += aktie["antal"] * aktie["udbytte"] * aktie["frekvens"]
-    return samlet
-
-årligt_udbytte = beregn_årligt_udbytte()
-udbytte_pr_sekund = årligt_udbytte / SEKUNDERPRÅR
-
-#Find hvor mange sekunder vi er inde i året
-nu = datetime.datetime.now()
-startafåret = datetime.datetime(nu.year, 1, 1)
-sekunder_gået = (nu - startafåret).total_seconds()
-
-#Beregn startværdi
-beløb = sekunder_gået * udbytte_pr_sekund
-
-# Afkast data with fake movement
-afkast_kroner = 1250.75  # Starting amount
-afkast_procent = 5.2     # Starting percentage
-
-# Fake afkast movement parameters
-afkast_change_per_second = 0.15  # Changes by 0.15 kr per second
-afkast_procent_change_per_second = 0.001  # Changes by 0.001% per second
-
-# Privacy/censoring functionality
-censored = False
-
-def toggle_censoring(event):
-    """Toggle between showing and censoring the dividend amount."""
-    global censored
-    censored = not censored
-    # Update display immediately
-    update_display_text()
-
-#GUI
-root = tk.Tk()
-root.title("Udbytte og Afkast i år (live)")
-root.geometry("330x120+100+100")  # Increased height for two lines
-root.overrideredirect(True)
-
-# Set up desktop widget functionality
-desktop_widget = DesktopWidget(root)
-
-# Schedule the window positioning after the window is created
-root.after(100, desktop_widget.setup_desktop_level)
-
-# Choose your preferred move method:
-# Option 1: Hold Ctrl + drag to move
-desktop_widget.make_draggable_with_key("ctrl")
-desktop_widget.enable_edge_snap(margin=30)
-
-# Optional: Set transparency (0.0 = fully transparent, 1.0 = fully opaque)
-desktop_widget.set_transparency(0.8)  # 80% opacity
-
-baggrundsfarve = "#000000"
-tekstfarve = "#00FF00"
-
-frame = tk.Frame(root, bg=baggrundsfarve)
-frame.pack(expand=True, fill="both")
-
-# Create two labels - one for dividend, one for returns, both left-aligned
-udbytte_label = tk.Label(frame, text="", bg=baggrundsfarve, fg=tekstfarve, font=("Consolas", 12), anchor="w", justify="left")
-udbytte_label.pack(padx=20, pady=(15, 5), fill="x")
-
-afkast_label = tk.Label(frame, text="", bg=baggrundsfarve, fg=tekstfarve, font=("Consolas", 12), anchor="w", justify="left")
-afkast_label.pack(padx=20, pady=(5, 15), fill="x")
-
-def update_display_text():
-    """Update the display text, considering censoring state."""
-    if censored:
-        udbytte_text = "Udbytte i år: ******* kr"
-        afkast_text = "Afkast i år:  ******* kr"
-    else:
-        udbytte_text = f"Udbytte i år: {beløb:.6f} kr"
-        afkast_text = f"Afkast i år:  {afkast_kroner:.2f} kr ({afkast_procent:.1f}%)"
-    
-    udbytte_label.config(text=udbytte_text)
-    afkast_label.config(text=afkast_text)
-
-def opdater():
-    global beløb, afkast_kroner, afkast_procent
-    
-    # Update dividend (existing logic)
-    beløb += udbytte_pr_sekund
-    
-    # Update afkast with fake movement
-    afkast_kroner += afkast_change_per_second
-    afkast_procent += afkast_procent_change_per_second
-    
-    update_display_text()
-    root.after(1000, opdater)
-
-# Bind Ctrl+E to toggle censoring for both labels
-root.bind('<Control-e>', toggle_censoring)
-frame.bind('<Control-e>', toggle_censoring)
-udbytte_label.bind('<Control-e>', toggle_censoring)
-afkast_label.bind('<Control-e>', toggle_censoring)
-
-opdater()
-root.mainloop()
\ No newline at end of file
+from helpers.tk_host import TkWidgetHost
+from helpers.tk_render import TkRenderer
+from helpers.returns import ReturnsEngine
+from helpers.quotes import QuoteFeed
+from helpers.fx import fx_rates
+from helpers.refresh import RefreshPolicy, MarketHours, seconds_until_display_change
+from portefolje import byg_udbyttekalender, byg_værdiansættelse, opret_kurs_kilde, markedstider
+
+
+class SaldoWidget:
+    """Live dividend and return (afkast) counters for this year."""
+
+    update_interval = 1000  # ms
+
+    def __init__(self, root, host=None):
+        """
+        Build the widget in root.
+
+        Args:
+            root: tk.Tk or tk.Toplevel window to build in
+            host: TkWidgetHost running the widget (optional)
+        """
+        self.root = root
+        self.host = host
+        self.renderer = host.renderer if host else TkRenderer()
+
+        # Udbytte i år slås op i udbyttekalenderen ud fra uret ved hver opdatering.
+        # Kalenderen er omregnet til kr og bygges kun om når valutakurserne skifter
+        self.valutakurser = fx_rates.rates()
+        self.udbyttekalender = byg_udbyttekalender(self.valutakurser)
+        self.beløb = self.udbyttekalender.accrued_this_year()
+
+        # Afkast follows live prices; each quote only updates its own position
+        self.værdiansættelse = byg_værdiansættelse(self.valutakurser)
+        self.afkast_motor = ReturnsEngine(self.værdiansættelse)
+        self.afkast_kroner = self.afkast_motor.return_kr
+        self.afkast_procent = self.afkast_motor.return_pct
+
+        # Quotes are fetched on a worker thread and picked up on the next tick
+        self.kurs_feed = QuoteFeed(opret_kurs_kilde())
+        self.nye_kurser = None
+        root.bind("<Destroy>", self.on_destroy, add="+")
+
+        # Back off when nothing on screen can change (censored, or markets
+        # closed and the dividend digits still), the window is hidden, or
+        # the user is away. Quotes are only fetched while the market is open
+        self.opdateringspolitik = RefreshPolicy(self.update_interval)
+        # Resume the normal pace as soon as the window is shown again
+        root.bind("<Map>", self.on_map, add="+")
+        self.marked = MarketHours.from_config(markedstider)
+        self.kurser_hentet = False  # One fetch at startup even when closed
+
+        # Privacy/censoring functionality
+        self.censored = False
+
+        #GUI
+        root.title("Udbytte og Afkast i år (live)")
+        root.geometry("330x120+100+100")  # Increased height for two lines
+        root.overrideredirect(True)
+
+        # Set up desktop widget functionality
+        self.desktop_widget = DesktopWidget(root)
+
+        # Schedule the window positioning after the window is created
+        root.after(100, self.desktop_widget.setup_desktop_level)
+
+        # Choose your preferred move method:
+        # Option 1: Hold Ctrl + drag to move
+        self.desktop_widget.make_draggable_with_key("ctrl")
+        self.desktop_widget.enable_edge_snap(margin=30)
+
+        # Optional: Set transparency (0.0 = fully transparent, 1.0 = fully opaque)
+        self.desktop_widget.set_transparency(0.8)  # 80% opacity
+
+        baggrundsfarve = "#000000"
+        tekstfarve = "#00FF00"
+
+        frame = tk.Frame(root, bg=baggrundsfarve)
+        frame.pack(expand=True, fill="both")
+
+        # Create two labels - one for dividend, one for returns, both left-aligned
+        self.udbytte_label = tk.Label(frame, text="", bg=baggrundsfarve, fg=tekstfarve, font=("Consolas", 12), anchor="w", justify="left")
+        self.udbytte_label.pack(padx=20, pady=(15, 5), fill="x")
+
+        self.afkast_label = tk.Label(frame, text="", bg=baggrundsfarve, fg=tekstfarve, font=("Consolas", 12), anchor="w", justify="left")
+        self.afkast_label.pack(padx=20, pady=(5, 15), fill="x")
+
+        # Bind Ctrl+E to toggle censoring for both labels
+        for widget in (root, frame, self.udbytte_label, self.afkast_label):
+            widget.bind('<Control-e>', self.toggle_censoring)
+
+    def toggle_censoring(self, event):
+        """Toggle between showing and censoring the dividend amount."""
+        self.censored = not self.censored
+        # Update display immediately and resume normal ticks when uncensored
+        self.update_display_text()
+        self.planlæg_næste(time.time())
+
+    def update_display_text(self):
+        """Update the display text, considering censoring state."""
+        if self.censored:
+            udbytte_text = "Udbytte i år: ******* kr"
+            afkast_text = "Afkast i år:  ******* kr"
+        else:
+            udbytte_text = f"Udbytte i år: {self.beløb:.6f} kr"
+            afkast_text = f"Afkast i år:  {self.afkast_kroner:.2f} kr ({self.afkast_procent:.1f}%)"
+
+        # Only labels whose text changed are sent to Tk
+        self.renderer.set_text(self.udbytte_label, udbytte_text)
+        self.renderer.set_text(self.afkast_label, afkast_text)
+
+    def opdater(self):
+        """Called by the host scheduler every update_interval."""
+        # Rebuild kroner amounts when the FX table has been refreshed
+        valutakurser = fx_rates.rates()
+        if valutakurser is not self.valutakurser:
+            self.valutakurser = valutakurser
+            self.udbyttekalender = byg_udbyttekalender(valutakurser)
+            self.afkast_motor.set_fx_rates(valutakurser)
+
+        # Update dividend from the clock
+        nu = time.time()
+        self.beløb = self.udbyttekalender.accrued_this_year(nu)
+
+        # Apply quotes that arrived since the last tick, then ask for fresh
+        # ones; outside trading hours prices don't move, so don't fetch
+        kurser, self.nye_kurser = self.nye_kurser, None
+        if kurser:
+            self.afkast_motor.apply_quotes(kurser)
+        self.afkast_kroner = self.afkast_motor.return_kr
+        self.afkast_procent = self.afkast_motor.return_pct
+        if self.marked is None or self.marked.is_open(nu) or not self.kurser_hentet:
+            self.kurs_feed.request(self.værdiansættelse.names, self.on_quotes)
+            self.kurser_hentet = True
+
+        self.update_display_text()
+        self.planlæg_næste(nu)
+
+    def planlæg_næste(self, nu):
+        """Defer the next tick until something shown can change."""
+        if not self.host:
+            return
+        if self.censored:
+            ændring_om = math.inf  # Nothing shown changes; toggle_censoring re-plans
+        elif self.marked is None or self.marked.is_open(nu):
+            ændring_om = 0.0  # Prices may move on every tick
+        else:
+            kalender = self.udbyttekalender
+            ændring_om = min(seconds_until_display_change(self.beløb, kalender.rate_at(nu), 6),
+                             kalender.next_rate_change(nu),
+                             self.marked.seconds_until_open(nu))
+        forsinkelse = self.opdateringspolitik.delay_ms(visible=self.root.winfo_viewable(), change_in=ændring_om)
+        self.host.defer(self.tick_job, forsinkelse)
+
+    def on_quotes(self, quotes):
+        """Runs on the feed's worker thread; Tk is only touched from opdater()."""
+        self.nye_kurser = quotes
+
+    def on_destroy(self, event):
+        """Stop the quote feed and drop the labels from the shared renderer."""
+        if event.widget is self.root:
+            self.kurs_feed.shutdown()
+            self.renderer.forget(self.udbytte_label)
+            self.renderer.forget(self.afkast_label)
+
+    def on_map(self, event):
+        """Bring a tick deferred while hidden back to the next regular one."""
+        if self.host:
+            self.host.defer(self.tick_job, 0)
+
+
+if __name__ == "__main__":
+    host = TkWidgetHost()
+    host.add(SaldoWidget)
+    host.run()
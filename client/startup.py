@@ -6,11 +6,46 @@ Launches multiple desktop widgets at once with flexible configuration.
 import sys
 import json
 import os
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import QTimer
+import logging
+import time
+import importlib
+import subprocess
 
-# Import widgets from current structure (web.py)
-from ui.web import WatchlistWidget, DesktopWebWidget
+# Widget types as "module:Class" so nothing is imported until a widget is
+# launched; Qt, QtWebEngine and psutil stay out of CLI commands entirely
+WIDGET_TYPES = {
+    'cpu': ('ui.web:DesktopWebWidget', "CPU usage monitor"),
+    'watchlist': ('ui.web:WatchlistWidget', "Stock price tracker"),
+    'stocks': ('ui.web:WatchlistWidget', "Alias for watchlist"),
+    'cpu_cores': ('ui.web:CpuCoresWidget', "Per-core CPU heatmap"),
+    'processes': ('ui.web:ProcessesWidget', "Top processes by CPU or memory"),
+}
+
+
+def load_widget_class(widget_type):
+    """
+    Import and return the class registered for a widget type.
+
+    Returns:
+        class, or None for unknown types
+    """
+    entry = WIDGET_TYPES.get(widget_type.lower())
+    if entry is None:
+        return None
+    module_name, class_name = entry[0].split(':')
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+# Worker threads preparing widget data at startup, and how often the GUI
+# thread checks whether the next widget's data is ready
+PREPARE_WORKERS = 8
+PREPARE_POLL_MS = 10
+
+# Command line flags that override the configured render mode
+RENDER_MODE_FLAGS = {
+    '--shared': 'shared',
+    '--per-widget': 'per_widget'
+}
 
 
 class WidgetStartupManager:
@@ -20,6 +55,11 @@ class WidgetStartupManager:
         self.config_file = os.path.join(os.path.dirname(__file__), 'startup_config.json')
         self.widgets = []
         self.app = None
+        self.render_mode = None  # Set from the command line to override config
+        self.pending = []  # (widget config, prepare future) waiting for a window
+        self.launch_started = None
+        self.expected = 0
+        self.painted = 0
         
     def load_config(self):
         """Load startup configuration from JSON file."""
@@ -36,8 +76,10 @@ class WidgetStartupManager:
                     "transparency": 0.9
                 }
             ],
-            "startup_delay": 500,  # Delay between widget launches (ms)
-            "auto_position": True   # Automatically offset widget positions
+            "auto_position": True,  # Automatically offset widget positions
+            "render_mode": "shared",  # One renderer for all web widgets
+            "quote_cache": {"ttl": 4.0, "max_entries": 1024},  # Shared by all watchlists
+            "metrics": {"interval": 1.0, "history": 300}  # System sampling for CPU widgets
         }
         
         try:
@@ -61,16 +103,11 @@ class WidgetStartupManager:
         except Exception as e:
             print(f"Error saving config: {e}")
             
-    def create_widget(self, widget_type):
-        """Create a widget instance based on type."""
-        widget_map = {
-            'cpu': DesktopWebWidget,
-            'watchlist': WatchlistWidget,
-            'stocks': WatchlistWidget  # Alias
-        }
-        
-        if widget_type.lower() in widget_map:
-            return widget_map[widget_type.lower()]()
+    def create_widget(self, widget_type, backend='web', options=None):
+        """Create a widget instance based on type, render backend and its config entry."""
+        widget_class = load_widget_class(widget_type)
+        if widget_class is not None:
+            return widget_class(backend, options)
         else:
             print(f"Warning: Unknown widget type '{widget_type}'")
             return None
@@ -80,26 +117,55 @@ class WidgetStartupManager:
         if config is None:
             config = self.load_config()
             
-        self.app = QApplication(sys.argv)
+        # Heavy imports happen here, once widgets are really being launched
+        from PyQt5.QtWidgets import QApplication
+        from PyQt5.QtCore import QTimer
+        from ui.web import set_render_mode, load_web_engine
+        from helpers.quote_cache import quote_cache
+        from helpers.metrics import metrics_collector
+        from concurrent.futures import ThreadPoolExecutor
         
-        enabled_widgets = [w for w in config['widgets'] if w.get('enabled', True)]
+        # Renderer flags must be in place before Qt starts
+        render_mode = self.render_mode or config.get('render_mode', 'per_widget')
+        set_render_mode(render_mode)
         
+        cache_config = config.get('quote_cache', {})
+        quote_cache.configure(cache_config.get('ttl'), cache_config.get('max_entries'))
+        
+        metrics_config = config.get('metrics', {})
+        metrics_collector.configure(metrics_config.get('interval'), metrics_config.get('history'))
+        
+        enabled_widgets = [w for w in config['widgets'] if w.get('enabled', True)]
         if not enabled_widgets:
             print("No widgets enabled in configuration.")
             return
             
-        print(f"Starting {len(enabled_widgets)} widgets...")
+        # Prepare every widget's data concurrently while Qt starts up
+        self.launch_started = time.perf_counter()
+        executor = ThreadPoolExecutor(max_workers=min(PREPARE_WORKERS, len(enabled_widgets)),
+                                      thread_name_prefix="widget-prepare")
+        for widget_config in enabled_widgets:
+            widget_class = load_widget_class(widget_config['type'])
+            if widget_class is None:
+                print(f"Warning: Unknown widget type '{widget_config['type']}'")
+                continue
+            self.pending.append((widget_config, executor.submit(self._prepare, widget_class, widget_config)))
+        executor.shutdown(wait=False)
+        self.expected = len(self.pending)
         
-        # Launch widgets with delays
-        for i, widget_config in enumerate(enabled_widgets):
-            widget_type = widget_config['type']
-            transparency = widget_config.get('transparency', 0.9)
-            
-            # Use QTimer to delay widget creation
-            QTimer.singleShot(
-                i * config.get('startup_delay', 500),
-                lambda t=widget_type, a=transparency: self._create_and_show_widget(t, a)
-            )
+        # QtWebEngine has to be loaded before the QApplication exists, and is
+        # skipped entirely when every widget uses the native backend
+        if any(w.get('backend', 'web') == 'web' for w in enabled_widgets):
+            load_web_engine()
+            print(f"Render mode: {render_mode}")
+        
+        self.app = QApplication(sys.argv)
+        
+        print(f"Starting {self.expected} widgets...")
+        
+        # Windows are created one per event loop pass as soon as their data
+        # is ready, so each can paint before the next one is built
+        QTimer.singleShot(0, self._create_next)
             
         print("Widget startup initiated!")
         print("Controls (all widgets):")
@@ -110,16 +176,72 @@ class WidgetStartupManager:
         print(f"\nConfiguration file: {self.config_file}")
         
         # Run the application
-        sys.exit(self.app.exec_())
+        exit_code = self.app.exec_()
+        print(quote_cache.summary())
+        sys.exit(exit_code)
+        
+    @staticmethod
+    def _prepare(widget_class, options):
+        """Run a widget's prepare() on a worker thread and return how long it took (ms)."""
+        started = time.perf_counter()
+        widget_class.prepare(options)
+        return (time.perf_counter() - started) * 1000
+        
+    def _create_next(self):
+        """Create the first widget whose preparation is done, then yield to the event loop."""
+        from PyQt5.QtCore import QTimer
+        if not self.pending:
+            return
+        ready = next((entry for entry in self.pending if entry[1].done()), None)
+        if ready is None:
+            QTimer.singleShot(PREPARE_POLL_MS, self._create_next)
+            return
+        self.pending.remove(ready)
+        widget_config, future = ready
         
-    def _create_and_show_widget(self, widget_type, transparency):
-        """Create and show a single widget (called by QTimer)."""
-        widget = self.create_widget(widget_type)
+        try:
+            prepare_ms = future.result()
+        except Exception as e:
+            # The widget still starts; it fetches its data on the first tick
+            print(f"Warning: Preparing {widget_config['type']} widget failed: {e}")
+            prepare_ms = 0.0
+        try:
+            self._create_and_show_widget(widget_config['type'], widget_config.get('transparency', 0.9),
+                                         widget_config.get('backend', 'web'), widget_config, prepare_ms)
+        except Exception as e:
+            print(f"Warning: Could not start {widget_config['type']} widget: {e}")
+            self.expected -= 1
+            self._check_all_painted()
+        finally:
+            QTimer.singleShot(0, self._create_next)
+        
+    def _create_and_show_widget(self, widget_type, transparency, backend='web', options=None, prepare_ms=0.0):
+        """Create and show a single widget (called from the event loop)."""
+        started = time.perf_counter()
+        widget = self.create_widget(widget_type, backend, options)
         if widget:
             widget.set_transparency(transparency)
+            widget.on_first_paint(self._on_first_paint)
             widget.show()
             self.widgets.append(widget)
-            print(f"✓ {widget_type.title()} widget started")
+            create_ms = (time.perf_counter() - started) * 1000
+            print(f"✓ {widget_type.title()} widget started (prepared in {prepare_ms:.0f} ms, created in {create_ms:.0f} ms)")
+        else:
+            self.expected -= 1
+            self._check_all_painted()
+            
+    def _on_first_paint(self, widget):
+        """Report time-to-first-paint, measured from the start of launch_widgets()."""
+        elapsed = (time.perf_counter() - self.launch_started) * 1000
+        self.painted += 1
+        print(f"  {widget.widget_name}: first paint after {elapsed:.0f} ms")
+        self._check_all_painted()
+        
+    def _check_all_painted(self):
+        """Print the total once every widget that started has painted."""
+        if self.painted and self.painted == self.expected and not self.pending:
+            elapsed = (time.perf_counter() - self.launch_started) * 1000
+            print(f"All {self.expected} widgets painted after {elapsed:.0f} ms")
             
     def list_widgets(self):
         """List all running widgets."""
@@ -127,19 +249,80 @@ class WidgetStartupManager:
             print("No widgets currently running.")
             return
             
+        from helpers.quote_cache import quote_cache
         print(f"Running widgets ({len(self.widgets)}):")
         for i, widget in enumerate(self.widgets, 1):
             widget_name = getattr(widget, 'widget_name', 'unknown')
             pos = widget.pos()
             print(f"  {i}. {widget_name} at ({pos.x()}, {pos.y()})")
+        print(quote_cache.summary())
+
+            
+    def import_report(self, config=None, limit=15):
+        """
+        Measure what launching the configured widgets imports, using
+        python -X importtime in a fresh interpreter so nothing is cached.
+        
+        Args:
+            config: dict - configuration to measure (default: startup_config.json)
+            limit: int - number of slowest modules to list
+        """
+        if config is None:
+            config = self.load_config()
+        enabled_widgets = [w for w in config['widgets'] if w.get('enabled', True)]
+        
+        modules = {'PyQt5.QtWidgets'}
+        for widget_config in enabled_widgets:
+            entry = WIDGET_TYPES.get(widget_config['type'].lower())
+            if entry:
+                modules.add(entry[0].split(':')[0])
+        if any(w.get('backend', 'web') == 'web' for w in enabled_widgets):
+            modules.add('PyQt5.QtWebEngineWidgets')
+        
+        code = "; ".join(f"import {name}" for name in sorted(modules))
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', code],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True
+        )
+        
+        # Lines look like "import time:  self [us] | cumulative | imported package"
+        timings = []
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:') or 'self [us]' in line:
+                continue
+            own, cumulative, name = line[len('import time:'):].split('|')
+            timings.append((int(own), int(cumulative), name.rstrip()[1:]))  # Nesting shows as extra indent
+        if result.returncode != 0:
+            print(f"Error: Importing the widget modules failed:\n{result.stderr.splitlines()[-1]}")
+            return
+            
+        # Top-level entries (no indentation) add up to the whole import time
+        total = sum(cumulative for _, cumulative, name in timings if not name.startswith(' '))
+        print(f"Imports for {len(enabled_widgets)} enabled widgets: {total / 1000:.1f} ms, {len(timings)} modules")
+        for name in sorted(modules):
+            cumulative = next((c for _, c, n in timings if n.strip() == name), 0)
+            print(f"  {name:<28} {cumulative / 1000:8.1f} ms")
+        print("\nSlowest modules (self time):")
+        for own, cumulative, name in sorted(timings, reverse=True)[:limit]:
+            print(f"  {name.strip():<40} {own / 1000:8.1f} ms")
 
 
 def main():
     """Main entry point for startup manager."""
     manager = WidgetStartupManager()
     
-    if len(sys.argv) > 1:
-        command = sys.argv[1].lower()
+    args = sys.argv[1:]
+    if '--debug' in args:
+        logging.basicConfig(level=logging.DEBUG, format="%(name)s: %(message)s")
+        args.remove('--debug')
+    for flag, mode in RENDER_MODE_FLAGS.items():
+        if flag in args:
+            manager.render_mode = mode
+            args.remove(flag)
+    
+    if args:
+        command = args[0].lower()
         
         if command == "config":
             # Show current configuration
@@ -164,7 +347,16 @@ def main():
             else:
                 print("Configuration file doesn't exist.")
                 
-        elif command in ["help", "h", "?"]:
+        elif command in ["list", "--list"]:
+            # Widget types from the registry; imports nothing
+            for name, (spec, description) in WIDGET_TYPES.items():
+                print(f"  {name:<10} {description:<32} ({spec})")
+                
+        elif command == "importtime":
+            # Where startup time goes for the configured widgets
+            manager.import_report()
+            
+        elif command in ["help", "--help", "-h", "h", "?"]:
             print_help()
             
         else:
@@ -185,12 +377,19 @@ Usage:
     python startup.py config    # Show current configuration
     python startup.py edit      # Edit configuration file
     python startup.py reset     # Reset configuration to defaults
-    python startup.py help      # Show this help
+    python startup.py list      # List available widget types
+    python startup.py importtime  # Report import cost of the enabled widgets
+    python startup.py help      # Show this help (also --help, -h)
+
+Options:
+    --shared                    # All web widgets share one renderer process
+    --per-widget                # Every web widget gets its own page/renderer
+    --debug                     # Log drag and input events
 
 Configuration File:
     - Located at: startup_config.json
     - Controls which widgets to start
-    - Set transparency, delays, and other options
+    - Set transparency, backends, and other options
     - Auto-created with defaults if missing
 
 Example Configuration:
@@ -204,17 +403,26 @@ Example Configuration:
     {
       "type": "watchlist",
       "enabled": true,
-      "transparency": 0.85
+      "transparency": 0.85,
+      "backend": "native"
     }
   ],
-  "startup_delay": 500,
-  "auto_position": true
+  "auto_position": true,
+  "render_mode": "shared",
+  "quote_cache": {"ttl": 4.0, "max_entries": 1024},
+  "metrics": {"interval": 1.0, "history": 300}
 }
 
 Available Widget Types:
     - cpu        # CPU usage monitor
     - watchlist  # Stock price tracker
     - stocks     # Alias for watchlist
+    - cpu_cores  # Per-core CPU heatmap
+    - processes  # Top processes by CPU or memory
+
+Render Backends (per widget "backend" key):
+    - web        # QtWebEngine/HTML rendering (default)
+    - native     # QPainter rendering, no QtWebEngine needed
 """)
 
 
@@ -225,7 +433,6 @@ def create_minimal_config():
         "widgets": [
             {"type": "cpu", "enabled": True, "transparency": 0.9}
         ],
-        "startup_delay": 0,
         "auto_position": True
     }
 
@@ -236,7 +443,6 @@ def create_full_config():
             {"type": "cpu", "enabled": True, "transparency": 0.9},
             {"type": "watchlist", "enabled": True, "transparency": 0.9}
         ],
-        "startup_delay": 800,
         "auto_position": True
     }
 
@@ -246,7 +452,6 @@ def create_trading_config():
         "widgets": [
             {"type": "watchlist", "enabled": True, "transparency": 0.95}
         ],
-        "startup_delay": 0,
         "auto_position": True
     }
 
@@ -0,0 +1,95 @@
+import os
+import sys
+import tempfile
+import unittest
+
+# Make the client directory importable when run from anywhere
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from helpers.broker_import import parse_number, parse_transactions, load_positions
+
+
+class ParseNumberTest(unittest.TestCase):
+
+    def test_known_decimal_comma(self):
+        self.assertEqual(parse_number("4,215", ','), 4.215)
+        self.assertEqual(parse_number("10.500", ','), 10500.0)
+        self.assertEqual(parse_number("1.234,50", ','), 1234.5)
+
+    def test_known_decimal_point(self):
+        self.assertEqual(parse_number("10.500", '.'), 10.5)
+        self.assertEqual(parse_number("1,234.50", '.'), 1234.5)
+
+    def test_guessed_format(self):
+        self.assertEqual(parse_number("1,234.50"), 1234.5)
+        self.assertEqual(parse_number("1.234,50"), 1234.5)
+        self.assertEqual(parse_number("1 234,5"), 1234.5)
+        self.assertEqual(parse_number("1.234.567"), 1234567.0)
+        self.assertEqual(parse_number("0.125"), 0.125)
+        self.assertEqual(parse_number("-0,125"), -0.125)
+        self.assertEqual(parse_number(""), 0.0)
+
+    def test_ambiguous_without_convention(self):
+        with self.assertRaises(ValueError):
+            parse_number("4,215")
+        with self.assertRaises(ValueError):
+            parse_number("1.2.3,4,5")
+
+
+class ParseTransactionsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def write(self, text):
+        path = os.path.join(self.dir.name, "export.csv")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        return path
+
+    def test_danish_semicolon_export(self):
+        path = self.write(
+            "Handelsdag;Transaktionstype;Værdipapirer;Antal;Kurs;Valuta\n"
+            "02-01-2024;Køb;TKA.DE;100;4,215;EUR\n"
+            "03-01-2024;Køb;TKA.DE;100;6,125;EUR\n"
+            "04-01-2024;Salg;TKA.DE;50;6,000;EUR\n"
+        )
+        positions = parse_transactions(path)
+        self.assertEqual(len(positions), 1)
+        self.assertEqual(str(positions[0]['symbol']), "TKA.DE")
+        self.assertAlmostEqual(positions[0]['quantity'], 150.0)
+        self.assertAlmostEqual(positions[0]['cost_basis'], 5.17)
+
+    def test_english_comma_export(self):
+        path = self.write(
+            "Date,Type,Symbol,Quantity,Price,Currency\n"
+            '2024-01-02,Buy,AAPL,0.125,"1,234.50",USD\n'
+            "2024-01-03,Buy,AAPL,10.500,189.250,USD\n"
+        )
+        positions = parse_transactions(path)
+        self.assertAlmostEqual(positions[0]['quantity'], 10.625)
+        self.assertAlmostEqual(positions[0]['cost_basis'], (0.125 * 1234.5 + 10.5 * 189.25) / 10.625)
+
+    def test_unreadable_trade_fails_import(self):
+        path = self.write(
+            "Date,Type,Symbol,Quantity,Price\n"
+            "2024-01-02,Buy,AAPL,10,abc\n"
+        )
+        with self.assertRaises(ValueError):
+            parse_transactions(path)
+        with self.assertRaises(ValueError):
+            load_positions(path)
+        self.assertEqual(os.listdir(self.dir.name), ["export.csv"])  # Nothing cached
+
+    def test_empty_export(self):
+        with self.assertRaises(ValueError):
+            parse_transactions(self.write(""))
+        with self.assertRaises(ValueError):
+            parse_transactions(self.write("Symbol\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
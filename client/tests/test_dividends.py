@@ -0,0 +1,34 @@
+import os
+import sys
+import datetime
+import unittest
+
+# Make the client directory importable when run from anywhere
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from helpers.dividends import DividendSchedule, Holding, yearly_events, date_to_timestamp
+
+
+def at(year, month, day):
+    return date_to_timestamp(datetime.date(year, month, day))
+
+
+class DividendScheduleTest(unittest.TestCase):
+
+    def test_nothing_accrues_before_acquisition(self):
+        events = yearly_events(["09-01"], 10.0, 2025, 2025)
+        schedule = DividendSchedule([Holding("A", 1, events, acquired=datetime.date(2025, 6, 1))])
+        self.assertEqual(schedule.accrued_at(at(2025, 5, 1)), 0.0)
+        self.assertEqual(schedule.accrued_at(at(2025, 6, 1)), 0.0)
+        self.assertGreater(schedule.accrued_at(at(2025, 7, 1)), 0.0)
+        self.assertAlmostEqual(schedule.accrued_at(at(2025, 9, 4)), 10.0)
+
+    def test_not_entitled_after_ex_date(self):
+        events = yearly_events(["09-01"], 10.0, 2025, 2025)
+        schedule = DividendSchedule([Holding("A", 1, events, acquired=datetime.date(2025, 9, 2))])
+        self.assertEqual(schedule.received_at(at(2025, 12, 31)), 0.0)
+        self.assertEqual(schedule.accrued_at(at(2025, 12, 31)), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import os
+import sys
+import unittest
+
+# Make the client directory importable when run from anywhere
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from helpers.history import Ring, TieredHistory
+
+
+class RingTest(unittest.TestCase):
+
+    def test_wraps_and_keeps_newest(self):
+        ring = Ring(3)
+        self.assertIsNone(ring.latest())
+        for value in range(5):
+            ring.append(value)
+        self.assertEqual(ring.last(), [2, 3, 4])
+        self.assertEqual(ring.last(2), [3, 4])
+        self.assertEqual(ring.latest(), 4)
+
+
+class TieredHistoryTest(unittest.TestCase):
+
+    def minute_of_samples(self, interval):
+        history = TieredHistory()
+        timestamp = 0.0
+        while timestamp < 61:
+            history.add(timestamp, 1.0)
+            timestamp += interval
+        return history.last(1)
+
+    def test_one_point_per_second_for_any_interval(self):
+        for interval in (0.5, 1.0, 2.0, 5.0):
+            points = self.minute_of_samples(interval)
+            self.assertTrue(56 <= len(points) <= 60, (interval, len(points)))
+
+    def test_long_gap_is_not_filled(self):
+        history = TieredHistory()
+        history.add(0, 1.0)
+        history.add(10000, 2.0)
+        self.assertEqual(history.last(1), [1.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
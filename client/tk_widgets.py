@@ -0,0 +1,54 @@
+"""
+Tk Widget Host
+Runs several Tk widgets in one process, sharing a single Tk interpreter,
+event loop and update scheduler.
+"""
+
+import sys
+from helpers.tk_host import TkWidgetHost
+from udbytte import UdbytteWidget
+from saldo import SaldoWidget
+
+# Available Tk widget types
+TK_WIDGETS = {
+    'udbytte': UdbytteWidget,
+    'saldo': SaldoWidget
+}
+
+
+def main():
+    """
+    Launch the Tk widgets named on the command line (default: all).
+    --fps N animates counters at up to N frames per second.
+    """
+    args = sys.argv[1:]
+    fps = 0
+    if '--fps' in args:
+        index = args.index('--fps')
+        try:
+            fps = int(args[index + 1])
+        except (IndexError, ValueError):
+            print("--fps needs a number, e.g. --fps 30")
+            sys.exit(1)
+        del args[index:index + 2]
+    names = [name.lower() for name in args] or list(TK_WIDGETS)
+    
+    unknown = [name for name in names if name not in TK_WIDGETS]
+    if unknown:
+        print(f"Unknown widget type(s): {', '.join(unknown)}")
+        print(f"Available: {', '.join(TK_WIDGETS)}")
+        sys.exit(1)
+    
+    host = TkWidgetHost(fps)
+    for i, name in enumerate(names):
+        widget = host.add(TK_WIDGETS[name])
+        # Stack widgets so they don't start on top of each other
+        widget.root.geometry(f"+100+{100 + i * 140}")
+        print(f"✓ {name.title()} widget started")
+    
+    print(f"Running {len(names)} Tk widgets in one process")
+    host.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,71 +1,133 @@
 import tkinter as tk
+import math
 import time
-import datetime
 from helpers.desktop_widget import DesktopWidget
-
-#Aktiedata
-aktier = {
-    "Novo Nordisk":     {"antal": 7,  "udbytte": 6.0,   "frekvens": 2},   # 6 kr x 2 per år = 12 kr/aktie/år
-    "Simon Property":   {"antal": 2,  "udbytte": 7.6,   "frekvens": 4},
-    "Tesla":            {"antal": 66, "udbytte": 0.0,   "frekvens": 0},
-    "thyssenkrupp AG":  {"antal": 29, "udbytte": 0.15,  "frekvens": 1},
-    "Vestjysk Bank":    {"antal": 28, "udbytte": 0.20,  "frekvens": 1}
-}
-
-SEKUNDERPRÅR = 365 * 24 * 60 * 60
-
-#Beregn årligt og pr. sekund
-def beregn_årligt_udbytte():
-    samlet = 0
-    for aktie in aktier.values():
-        samlet += aktie["antal"] * aktie["udbytte"] * aktie["frekvens"]
-    return samlet
-
-årligt_udbytte = beregn_årligt_udbytte()
-udbytte_pr_sekund = årligt_udbytte / SEKUNDERPRÅR
-
-#Find hvor mange sekunder vi er inde i året
-nu = datetime.datetime.now()
-startafåret = datetime.datetime(nu.year, 1, 1)
-sekunder_gået = (nu - startafåret).total_seconds()
-
-#Beregn startværdi
-beløb = sekunder_gået * udbytte_pr_sekund
-
-#GUI
-root = tk.Tk()
-root.title("Udbytte i år (live)")
-root.geometry("300x100+100+100")
-root.overrideredirect(True)
-
-# Set up desktop widget functionality
-desktop_widget = DesktopWidget(root)
-
-# Schedule the window positioning after the window is created
-root.after(100, desktop_widget.setup_desktop_level)
-
-# Choose your preferred move method:
-# Option 1: Hold Ctrl + drag to move
-desktop_widget.make_draggable_with_key("ctrl")
-desktop_widget.enable_edge_snap(margin=30)
-
-# Optional: Set transparency (0.0 = fully transparent, 1.0 = fully opaque)
-desktop_widget.set_transparency(0.8)  # 80% opacity
-
-baggrundsfarve = "#000000"
-tekstfarve = "#00FF00"
-
-frame = tk.Frame(root, bg=baggrundsfarve)
-frame.pack(expand=True, fill="both")
-
-label = tk.Label(frame, text="", bg=baggrundsfarve, fg=tekstfarve, font=("Consolas", 12))
-label.pack(padx=10, pady=20)
-
-def opdater():
-    global beløb
-    beløb += udbytte_pr_sekund
-    label.config(text=f"Udbytte i år: {beløb:.6f} kr")
-    root.after(1000, opdater)
-
-opdater()
-root.mainloop()
\ No newline at end of file
+from helpers.tk_host import TkWidgetHost
+from helpers.tk_render import TkRenderer, GlyphText
+from helpers.animation import CounterAnimation
+from helpers.fx import fx_rates
+from helpers.refresh import RefreshPolicy, seconds_until_display_change
+from portefolje import byg_udbyttekalender
+
+
+class UdbytteWidget:
+    """Live counter for dividend earned so far this year."""
+
+    update_interval = 1000  # ms
+
+    def __init__(self, root, host=None):
+        """
+        Build the widget in root.
+
+        Args:
+            root: tk.Tk or tk.Toplevel window to build in
+            host: TkWidgetHost running the widget (optional)
+        """
+        self.root = root
+        self.host = host
+        self.renderer = host.renderer if host else TkRenderer()
+
+        # Udbytte i år slås op i udbyttekalenderen ud fra uret ved hver opdatering.
+        # Kalenderen er omregnet til kr og bygges kun om når valutakurserne skifter
+        self.valutakurser = fx_rates.rates()
+        self.udbyttekalender = byg_udbyttekalender(self.valutakurser)
+        self.beløb = self.udbyttekalender.accrued_this_year()
+
+        # Opdateringer springes over indtil de viste decimaler faktisk ændrer sig,
+        # og skrues ned når vinduet er skjult eller brugeren er væk
+        self.opdateringspolitik = RefreshPolicy(self.update_interval)
+        # Kom tilbage til normal takt så snart vinduet vises igen
+        root.bind("<Map>", self.on_map, add="+")
+
+        #GUI
+        root.title("Udbytte i år (live)")
+        root.geometry("300x100+100+100")
+        root.overrideredirect(True)
+
+        # Set up desktop widget functionality
+        self.desktop_widget = DesktopWidget(root)
+
+        # Schedule the window positioning after the window is created
+        root.after(100, self.desktop_widget.setup_desktop_level)
+
+        # Choose your preferred move method:
+        # Option 1: Hold Ctrl + drag to move
+        self.desktop_widget.make_draggable_with_key("ctrl")
+        self.desktop_widget.enable_edge_snap(margin=30)
+
+        # Optional: Set transparency (0.0 = fully transparent, 1.0 = fully opaque)
+        self.desktop_widget.set_transparency(0.8)  # 80% opacity
+
+        baggrundsfarve = "#000000"
+        tekstfarve = "#00FF00"
+
+        frame = tk.Frame(root, bg=baggrundsfarve)
+        frame.pack(expand=True, fill="both")
+
+        self.animation = None
+        if host and host.frame_clock:
+            # Animeret tæller: værtens fælles billedur tegner, og kun de cifre
+            # der skifter tegnes om. opdater() holder bare kalenderen ajour
+            lærred = tk.Canvas(frame, bg=baggrundsfarve, highlightthickness=0)
+            lærred.pack(expand=True, fill="both")
+            tekst = GlyphText(lærred, 150, 50, ("Consolas", 12), tekstfarve)
+            self.animation = CounterAnimation(
+                tekst.set,
+                lambda nu: self.udbyttekalender.accrued_this_year(nu),
+                lambda nu: self.udbyttekalender.rate_at(nu),
+                template="Udbytte i år: {:.6f} kr",
+            )
+            host.frame_clock.add(self.animation)
+            root.bind("<Unmap>", self.on_unmap, add="+")
+        else:
+            self.label = tk.Label(frame, text="", bg=baggrundsfarve, fg=tekstfarve, font=("Consolas", 12))
+            self.label.pack(padx=10, pady=20)
+        root.bind("<Destroy>", self.on_destroy, add="+")
+
+    def opdater(self):
+        """Called by the host scheduler every update_interval."""
+        valutakurser = fx_rates.rates()
+        if valutakurser is not self.valutakurser:
+            self.valutakurser = valutakurser
+            self.udbyttekalender = byg_udbyttekalender(valutakurser)
+        nu = time.time()
+        self.beløb = self.udbyttekalender.accrued_this_year(nu)
+        if self.animation:
+            # Billeduret tegner tælleren; her skal kun valutakurserne følges
+            ændring_om = math.inf
+        else:
+            self.renderer.set_text(self.label, f"Udbytte i år: {self.beløb:.6f} kr")
+            kalender = self.udbyttekalender
+            ændring_om = min(seconds_until_display_change(self.beløb, kalender.rate_at(nu), 6),
+                             kalender.next_rate_change(nu))
+
+        if self.host:
+            forsinkelse = self.opdateringspolitik.delay_ms(visible=self.root.winfo_viewable(), change_in=ændring_om)
+            self.host.defer(self.tick_job, forsinkelse)
+
+    def on_map(self, event):
+        """Bring a tick deferred while hidden back to the next regular one."""
+        if self.host:
+            self.host.defer(self.tick_job, 0)
+        if self.animation:
+            self.host.frame_clock.resume(self.animation)
+
+    def on_unmap(self, event):
+        """Stop drawing the animated counter while the window is hidden."""
+        if event.widget is self.root:
+            self.host.frame_clock.pause(self.animation)
+
+    def on_destroy(self, event):
+        """Drop this widget's entries from the shared renderer and frame clock."""
+        if event.widget is not self.root:
+            return
+        if self.animation:
+            self.host.frame_clock.remove(self.animation)
+        else:
+            self.renderer.forget(self.label)
+
+
+if __name__ == "__main__":
+    host = TkWidgetHost()
+    host.add(UdbytteWidget)
+    host.run()
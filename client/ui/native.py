@@ -0,0 +1,319 @@
+"""
+Native render backend
+QPainter implementations of the web widget views, for deployments that
+want the same iOS-style look without starting QtWebEngine.
+"""
+import math
+import time
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtCore import Qt, QRectF, QPointF, QVariantAnimation, QEasingCurve
+from PyQt5.QtGui import QPainter, QColor, QFont, QPen, QLinearGradient, QPolygonF
+
+FONT_FAMILY = "Segoe UI"
+
+# Points of CPU history drawn in the sparkline (shared with the web template)
+SPARKLINE_POINTS = 60
+
+# Height of the per-core heatmap area (shared with the web template)
+HEATMAP_HEIGHT = 100
+
+
+def make_font(pixel_size, weight=QFont.Normal):
+    """Create a font sized in pixels like the CSS templates."""
+    font = QFont(FONT_FAMILY)
+    font.setPixelSize(pixel_size)
+    font.setWeight(weight)
+    return font
+
+
+def heatmap_grid(count, width, height):
+    """Columns and rows for count cells in a width x height area, cells near square."""
+    cols = min(count, math.ceil(math.sqrt(count * width / height)))
+    return cols, math.ceil(count / cols)
+
+
+# Green (idle) to red (busy); the web template builds the same ramp
+HEAT_COLORS = [QColor.fromHslF((120 * (1 - p / 100)) / 360, 0.75, (22 + p * 0.28) / 100)
+               for p in range(101)]
+
+
+class NativeView(QWidget):
+    """
+    Base class for QPainter views. Accepts the same state dictionaries as
+    the web PagePatcher and repaints only when a value actually changed.
+    """
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+
+        self.rendered = {}  # Last value applied per key
+        self.stats = {'patches': 0, 'skipped': 0, 'last_patch_ms': 0.0}
+
+    def push(self, state):
+        """Apply the keys of state that changed and schedule a repaint."""
+        start = time.perf_counter()
+        diff = {key: value for key, value in state.items() if self.rendered.get(key) != value}
+        if not diff:
+            self.stats['skipped'] += 1
+            return
+        self.rendered.update(diff)
+        self.apply_state(diff)
+        self.update()
+        self.stats['patches'] += 1
+        self.stats['last_patch_ms'] = (time.perf_counter() - start) * 1000
+
+    def apply_state(self, diff):
+        """Hook for subclasses that keep derived state (e.g. animations)."""
+        pass
+
+    def paint_card(self, painter, rect, background, border):
+        """Paint the rounded card shared by all widgets."""
+        painter.setBrush(background)
+        if self.rendered.get('move_mode'):
+            painter.setPen(QPen(QColor(255, 255, 255, 128), 2))
+            rect = rect.adjusted(1, 1, -1, -1)
+        elif border is not None:
+            painter.setPen(QPen(border, 1))
+            rect = rect.adjusted(0.5, 0.5, -0.5, -0.5)
+        else:
+            painter.setPen(Qt.NoPen)
+        painter.drawRoundedRect(rect, 16, 16)
+
+
+class NativeCpuView(NativeView):
+    """QPainter version of the CPU usage template."""
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.bar_percent = 0.0
+
+        # Mirrors the CSS 'transition: width 0.4s ease'
+        self.bar_animation = QVariantAnimation(self)
+        self.bar_animation.setDuration(400)
+        self.bar_animation.setEasingCurve(QEasingCurve.InOutQuad)
+        self.bar_animation.valueChanged.connect(self._on_bar_value)
+
+    def _on_bar_value(self, value):
+        self.bar_percent = value
+        self.update()
+
+    def apply_state(self, diff):
+        if 'cpu_percent' in diff:
+            self.bar_animation.stop()
+            self.bar_animation.setStartValue(float(self.bar_percent))
+            self.bar_animation.setEndValue(float(diff['cpu_percent']))
+            self.bar_animation.start()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        card = QRectF(0, 0, 260, 120)
+        self.paint_card(painter, card, QColor(20, 20, 20, 217), None)
+
+        # Title
+        painter.setPen(QColor("#ffffff"))
+        painter.setFont(make_font(15, QFont.DemiBold))
+        painter.drawText(QRectF(20, 15, 220, 20), Qt.AlignLeft | Qt.AlignVCenter, "CPU Usage")
+
+        # Sparkline, right-aligned in fixed slots like the web template
+        history = self.rendered.get('cpu_history') or []
+        if len(history) > 1:
+            step = 80 / (SPARKLINE_POINTS - 1)
+            offset = SPARKLINE_POINTS - len(history)
+            line = QPolygonF([QPointF(160 + (offset + i) * step, 34 - value * 0.16)
+                              for i, value in enumerate(history)])
+            painter.setPen(QPen(QColor("#34c759"), 1.5, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
+            painter.setBrush(Qt.NoBrush)
+            painter.drawPolyline(line)
+
+        # Bar track and fill
+        track = QRectF(20, 45, 220, 16)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(255, 255, 255, 26))
+        painter.drawRoundedRect(track, 8, 8)
+
+        fill_width = track.width() * max(0.0, min(self.bar_percent, 100.0)) / 100
+        if fill_width > 0:
+            gradient = QLinearGradient(track.left(), 0, track.right(), 0)
+            gradient.setColorAt(0, QColor("#4cd964"))
+            gradient.setColorAt(1, QColor("#34c759"))
+            painter.setBrush(gradient)
+            painter.setClipRect(QRectF(track.left(), track.top(), fill_width, track.height()))
+            painter.drawRoundedRect(track, 8, 8)
+            painter.setClipping(False)
+
+        # Percentage label
+        painter.setPen(QColor("#cccccc"))
+        painter.setFont(make_font(13))
+        painter.drawText(QRectF(20, 67, 220, 18), Qt.AlignRight | Qt.AlignVCenter,
+                         f"{self.rendered.get('cpu_percent', 0)}%")
+
+        # Help text
+        if self.rendered.get('help_visible'):
+            painter.setPen(QColor(255, 255, 255, 153))
+            painter.setFont(make_font(10))
+            painter.drawText(QRectF(0, 90, 260, 14), Qt.AlignCenter,
+                             "Ctrl+Drag to move • Double-click to lock/unlock")
+
+
+class NativeWatchlistView(NativeView):
+    """
+    QPainter version of the watchlist template. Like the web page it only
+    knows the visible row slots, so paint cost is independent of list length.
+    """
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.slots = []  # Per visible row: {'symbol', 'price', 'trend'}
+
+    def apply_state(self, diff):
+        for key, value in diff.items():
+            slot, _, field = key.partition('-')
+            if slot.startswith('row') and field in ('symbol', 'price', 'trend'):
+                index = int(slot[3:])
+                while len(self.slots) <= index:
+                    self.slots.append({'symbol': '', 'price': '', 'trend': None})
+                self.slots[index][field] = value
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        card = QRectF(0, 0, 160, 160)
+        self.paint_card(painter, card, QColor(0, 0, 0, 128), QColor(31, 41, 55, 77))
+
+        # Header
+        painter.setPen(QColor("#d1d5db"))
+        painter.setFont(make_font(12, QFont.Medium))
+        painter.drawText(QRectF(16, 16, 100, 20), Qt.AlignLeft | Qt.AlignVCenter, "Watchlist")
+        painter.setOpacity(0.7)
+        painter.setFont(make_font(16))
+        painter.drawText(QRectF(104, 16, 40, 20), Qt.AlignRight | Qt.AlignVCenter, "💲")
+        painter.setOpacity(1.0)
+
+        content = QRectF(16, 44, 128, 100)
+
+        # Scroll position for lists longer than the visible slots
+        scroll = self.rendered.get('scroll')
+        if scroll:
+            track_top, track_height = content.top(), content.height()
+            thumb = QRectF(152, track_top + scroll[0] * track_height, 3, scroll[1] * track_height)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(255, 255, 255, 77))
+            painter.drawRoundedRect(thumb, 1.5, 1.5)
+
+        if not self.slots:
+            return
+
+        # Rows spread evenly over the content area (justify-content: space-evenly)
+        row_height = 16
+        gap = (content.height() - row_height * len(self.slots)) / (len(self.slots) + 1)
+
+        price_font = make_font(12)
+        painter.setFont(price_font)
+        metrics = painter.fontMetrics()
+        arrow_width = metrics.horizontalAdvance('↗')
+
+        y = content.top() + gap
+        for row in self.slots:
+            line = QRectF(content.left(), y, content.width(), row_height)
+            y += row_height + gap
+            if not row['symbol']:
+                continue
+
+            painter.setPen(QColor("#9ca3af"))
+            painter.drawText(line, Qt.AlignLeft | Qt.AlignVCenter, row['symbol'])
+
+            if row['trend'] is not None:
+                up = row['trend']
+                painter.setPen(QColor("#4ade80") if up else QColor("#f87171"))
+                painter.drawText(line, Qt.AlignRight | Qt.AlignVCenter, '↗' if up else '↘')
+
+            if row['price']:
+                painter.setPen(QColor("white"))
+                price_rect = line.adjusted(0, 0, -(arrow_width + 4), 0)
+                painter.drawText(price_rect, Qt.AlignRight | Qt.AlignVCenter, f"${row['price']}")
+
+
+class NativeCoresView(NativeView):
+    """QPainter version of the per-core heatmap template."""
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        card = QRectF(0, 0, 260, 160)
+        self.paint_card(painter, card, QColor(20, 20, 20, 217), None)
+
+        # Header
+        painter.setPen(QColor("#ffffff"))
+        painter.setFont(make_font(15, QFont.DemiBold))
+        painter.drawText(QRectF(20, 12, 220, 20), Qt.AlignLeft | Qt.AlignVCenter, "CPU Cores")
+        painter.setPen(QColor("#cccccc"))
+        painter.setFont(make_font(11))
+        painter.drawText(QRectF(20, 12, 220, 20), Qt.AlignRight | Qt.AlignVCenter,
+                         self.rendered.get('summary', ''))
+
+        # Heatmap: one pass of plain rectangles, no antialiasing needed
+        cores = self.rendered.get('cores') or []
+        if cores:
+            painter.setRenderHint(QPainter.Antialiasing, False)
+            area = QRectF(20, 40, 220, HEATMAP_HEIGHT)
+            cols, rows = heatmap_grid(len(cores), area.width(), area.height())
+            w = area.width() / cols
+            h = area.height() / rows
+            gap = 1 if w > 4 and h > 4 else 0
+            painter.setPen(Qt.NoPen)
+            for i, value in enumerate(cores):
+                painter.fillRect(QRectF(area.left() + (i % cols) * w, area.top() + (i // cols) * h,
+                                        w - gap, h - gap), HEAT_COLORS[value])
+
+        # Help text
+        if self.rendered.get('help_visible'):
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(QColor(255, 255, 255, 153))
+            painter.setFont(make_font(10))
+            painter.drawText(QRectF(0, 142, 260, 14), Qt.AlignCenter,
+                             "Ctrl+Drag to move • Double-click to lock/unlock")
+
+
+class NativeProcessesView(NativeView):
+    """QPainter version of the top processes template."""
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        card = QRectF(0, 0, 260, 160)
+        self.paint_card(painter, card, QColor(20, 20, 20, 217), None)
+
+        # Header
+        painter.setPen(QColor("#ffffff"))
+        painter.setFont(make_font(15, QFont.DemiBold))
+        painter.drawText(QRectF(20, 12, 220, 20), Qt.AlignLeft | Qt.AlignVCenter, "Processes")
+        painter.setPen(QColor("#cccccc"))
+        painter.setFont(make_font(11))
+        painter.drawText(QRectF(20, 12, 220, 20), Qt.AlignRight | Qt.AlignVCenter,
+                         self.rendered.get('summary', ''))
+
+        # Rows: name elided on the left, CPU and memory in fixed columns
+        painter.setFont(make_font(12))
+        metrics = painter.fontMetrics()
+        y = 38
+        index = 0
+        while f'row{index}' in self.rendered:
+            row = self.rendered[f'row{index}']
+            index += 1
+            if row:
+                name, cpu, memory = row
+                painter.setPen(QColor("#f0f0f0"))
+                painter.drawText(QRectF(20, y, 116, 18), Qt.AlignLeft | Qt.AlignVCenter,
+                                 metrics.elidedText(name, Qt.ElideRight, 116))
+                painter.setPen(QColor("#cccccc"))
+                painter.drawText(QRectF(136, y, 52, 18), Qt.AlignRight | Qt.AlignVCenter, cpu)
+                painter.drawText(QRectF(188, y, 52, 18), Qt.AlignRight | Qt.AlignVCenter, memory)
+            y += 18
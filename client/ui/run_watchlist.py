@@ -11,9 +11,10 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from PyQt5.QtWidgets import QApplication
 
 # Import from the web.py file
-from web import WatchlistWidget
+from web import WatchlistWidget, load_web_engine
 
 def main():
+    load_web_engine()
     app = QApplication(sys.argv)
     
     # Create watchlist widget
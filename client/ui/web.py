@@ -1,21 +1,57 @@
 import sys
-import psutil
 import ctypes
 from ctypes import wintypes
 from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget
-from PyQt5.QtWebEngineWidgets import QWebEngineView
-from PyQt5.QtCore import Qt, QTimer, QPoint
+from PyQt5.QtCore import Qt, QTimer, QPoint, QUrl, QObject, QEvent, pyqtSignal
 from PyQt5.QtGui import QCursor
 import time
 import os
 import json
+import atexit
+import logging
+import tempfile
+import threading
+
+# Make the client directory importable when run as a script from ui/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ui.native import NativeCpuView, NativeWatchlistView, NativeCoresView, NativeProcessesView, SPARKLINE_POINTS, HEATMAP_HEIGHT
+from helpers.quotes import QuoteFeed, create_provider
+from helpers.quote_cache import quote_cache
+from helpers.scheduler import TickScheduler
+from helpers.refresh import RefreshPolicy, MarketHours
+from helpers.metrics import metrics_collector
+from helpers.processes import process_monitor
+
+# Drag and input tracing; enable with logging.DEBUG (startup.py --debug)
+log = logging.getLogger("widgets")
+
+# QtWebEngine is only imported when a web-backed widget is wanted, so
+# native-only setups never start Chromium. See load_web_engine().
+QtWebEngineWidgets = None
 
 class WidgetPositionManager:
-    """Simple position persistence manager using JSON file."""
+    """
+    Position persistence manager using a JSON file. Updates are kept in
+    memory and written by a background thread once they have settled for
+    the debounce interval, so dragging never blocks the GUI on disk I/O.
+    Pending changes are flushed at interpreter exit.
+    """
     
-    def __init__(self):
+    def __init__(self, debounce=0.5):
         self.config_file = os.path.join(os.path.dirname(__file__), 'widget_positions.json')
+        self.debounce = debounce  # Seconds of quiet before writing
         self.positions = self.load_positions()
+        
+        self._changed = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        self._closed = False
+        self._last_change = 0.0
+        
+        self._writer = threading.Thread(target=self._write_loop, name="position-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
     
     def load_positions(self):
         """Load widget positions from file."""
@@ -28,12 +64,43 @@ class WidgetPositionManager:
         return {}
     
     def save_positions(self):
-        """Save widget positions to file."""
-        try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.positions, f, indent=2)
-        except Exception as e:
-            print(f"Warning: Could not save positions: {e}")
+        """Write pending positions to file atomically (temp file + rename)."""
+        with self._write_lock:
+            with self._changed:
+                if not self._dirty:
+                    return
+                data = json.dumps(self.positions, indent=2)
+                self._dirty = False
+            
+            temp_path = None
+            try:
+                fd, temp_path = tempfile.mkstemp(
+                    prefix='.widget_positions.', suffix='.tmp',
+                    dir=os.path.dirname(self.config_file)
+                )
+                with os.fdopen(fd, 'w') as f:
+                    f.write(data)
+                os.replace(temp_path, self.config_file)
+            except Exception as e:
+                print(f"Warning: Could not save positions: {e}")
+                if temp_path and os.path.exists(temp_path):
+                    os.remove(temp_path)
+    
+    def _write_loop(self):
+        """Background writer: waits for changes, debounces, then saves."""
+        while True:
+            with self._changed:
+                while not self._dirty and not self._closed:
+                    self._changed.wait()
+                # Keep waiting while updates are still arriving
+                while not self._closed:
+                    remaining = self._last_change + self.debounce - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._changed.wait(remaining)
+                if self._closed:
+                    return
+            self.save_positions()
     
     def get_position(self, widget_name, default_x=50, default_y=50):
         """Get saved position for a widget."""
@@ -43,19 +110,198 @@ class WidgetPositionManager:
         return QPoint(default_x, default_y)
     
     def set_position(self, widget_name, x, y):
-        """Set position for a widget and save immediately."""
-        self.positions[widget_name] = {'x': x, 'y': y}
+        """Set position for a widget; it is written to disk shortly after."""
+        with self._changed:
+            if self.positions.get(widget_name) == {'x': x, 'y': y}:
+                return
+            self.positions[widget_name] = {'x': x, 'y': y}
+            self._dirty = True
+            self._last_change = time.monotonic()
+            self._changed.notify()
+    
+    def flush(self):
+        """Write pending changes now, on the calling thread."""
         self.save_positions()
+    
+    def close(self):
+        """Stop the writer thread and flush pending changes."""
+        with self._changed:
+            self._closed = True
+            self._changed.notify()
+        self.flush()
 
 # Global position manager instance
 position_manager = WidgetPositionManager()
 
+
+class ScreenCache:
+    """
+    Caches primary screen geometry and frame interval for the drag path.
+    Cleared whenever screens are added, removed or change geometry.
+    """
+    
+    def __init__(self):
+        self._geometry = None
+        self._frame_interval = None
+        self._connected = False
+        
+    def _connect(self):
+        """Subscribe to screen-change signals once a QApplication exists."""
+        app = QApplication.instance()
+        if self._connected or app is None:
+            return
+        app.screenAdded.connect(self._watch_screen)
+        app.screenRemoved.connect(self.invalidate)
+        app.primaryScreenChanged.connect(self.invalidate)
+        for screen in app.screens():
+            self._watch_screen(screen)
+        self._connected = True
+        
+    def _watch_screen(self, screen):
+        screen.geometryChanged.connect(self.invalidate)
+        screen.refreshRateChanged.connect(self.invalidate)
+        self.invalidate()
+        
+    def invalidate(self, *args):
+        """Forget cached values; they are re-read on next use."""
+        self._geometry = None
+        self._frame_interval = None
+        
+    def geometry(self):
+        """Primary screen geometry."""
+        if self._geometry is None:
+            self._connect()
+            self._geometry = QApplication.desktop().screenGeometry()
+        return self._geometry
+        
+    def frame_interval(self):
+        """Milliseconds per frame of the primary screen (60 Hz fallback)."""
+        if self._frame_interval is None:
+            self._connect()
+            screen = QApplication.primaryScreen()
+            rate = screen.refreshRate() if screen else 0
+            self._frame_interval = max(1, int(1000 / rate)) if rate > 0 else 16
+        return self._frame_interval
+
+# Global screen cache instance
+screen_cache = ScreenCache()
+
+
+class QtTimerDriver:
+    """Drives a TickScheduler from one single-shot QTimer."""
+    
+    def __init__(self):
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)  # Keep wall-clock alignment
+        self.timer.timeout.connect(self._fire)
+        self.callback = None
+        
+    def call_later(self, delay_ms, callback):
+        self.callback = callback
+        self.timer.start(delay_ms)
+        return self.timer
+        
+    def cancel_call(self, handle):
+        self.timer.stop()
+        
+    def _fire(self):
+        self.callback()
+
+_tick_scheduler = None
+
+def get_tick_scheduler():
+    """
+    Shared scheduler for all Qt widget updates in this process, so many
+    widgets wake up together on aligned ticks instead of each on its own
+    QTimer. Created on first use, once a QApplication exists.
+    """
+    global _tick_scheduler
+    if _tick_scheduler is None:
+        driver = QtTimerDriver()
+        _tick_scheduler = TickScheduler(driver.call_later, driver.cancel_call)
+        _tick_scheduler.driver = driver
+    return _tick_scheduler
+
+# Rendering modes for web widgets:
+#   'per_widget' - every view uses its own page on the default profile
+#   'shared'     - all views share one profile and one renderer process
+RENDER_MODES = ('per_widget', 'shared')
+render_mode = 'per_widget'
+_shared_profile = None
+
+# All widget pages load from the same origin so Chromium can place them
+# in a single renderer process when running in shared mode.
+WIDGET_BASE_URL = QUrl('file:///py_widgets/')
+
+def load_web_engine():
+    """
+    Import QtWebEngine. Qt requires this to happen before the QApplication
+    is created, so entry points call it up front when any widget uses the
+    web backend.
+    """
+    global QtWebEngineWidgets
+    if QtWebEngineWidgets is None:
+        from PyQt5 import QtWebEngineWidgets
+    return QtWebEngineWidgets
+
+def set_render_mode(mode):
+    """
+    Choose how web widgets use Chromium. Must be called before the
+    QApplication is created, since renderer flags are read at startup.
+    """
+    global render_mode
+    if mode not in RENDER_MODES:
+        raise ValueError(f"Unknown render mode '{mode}', expected one of {RENDER_MODES}")
+    render_mode = mode
+    
+    if mode == 'shared':
+        flags = os.environ.get('QTWEBENGINE_CHROMIUM_FLAGS', '').split()
+        for flag in ('--process-per-site', '--renderer-process-limit=1'):
+            if flag not in flags:
+                flags.append(flag)
+        os.environ['QTWEBENGINE_CHROMIUM_FLAGS'] = ' '.join(flags)
+
+def get_shared_profile():
+    """Return the in-memory profile shared by all widgets in shared mode."""
+    global _shared_profile
+    if _shared_profile is None:
+        profile_class = load_web_engine().QWebEngineProfile
+        _shared_profile = profile_class(QApplication.instance())
+        _shared_profile.setHttpCacheType(profile_class.MemoryHttpCache)
+        _shared_profile.setPersistentCookiesPolicy(profile_class.NoPersistentCookies)
+    return _shared_profile
+
+def create_web_view(parent):
+    """Create a QWebEngineView honouring the current render mode."""
+    engine = load_web_engine()
+    view = engine.QWebEngineView(parent)
+    if render_mode == 'shared':
+        view.setPage(engine.QWebEnginePage(get_shared_profile(), view))
+    return view
+
+# Shared page script: applies a diff of changed values by running the
+# binding each template registers per key, so only those nodes are touched.
+# Templates with generated keys (e.g. row slots) can set bindingFor(key).
+patch_script = """
+<script>
+  var bindings = {};
+  var bindingFor = null;
+  function applyState(state) {
+    for (var key in state) {
+      var bind = bindings[key] || (bindingFor && bindingFor(key));
+      if (bind) bind(state[key]);
+    }
+  }
+</script>
+"""
+
 # Basic HTML template styled like iOS battery widget
 html_template = """
 <html>
 <head>
 <style>
-  html, body {{
+  html, body {
     margin: 0;
     padding: 0;
     overflow: hidden;
@@ -65,60 +311,96 @@ html_template = """
     -webkit-user-select: none;
     pointer-events: none;  /* Make HTML non-interactive for dragging */
     background: transparent;
-  }}
-  .container {{
+  }
+  .container {
     background: rgba(20, 20, 20, 0.85);
     backdrop-filter: blur(12px);
     border-radius: 16px;
     padding: 15px 20px;
     width: 220px;
     box-shadow: 0 8px 20px rgba(0, 0, 0, 0.6);
-    border: {border_style};
-    cursor: {cursor_style};
-  }}
-  .title {{
+    border: none;
+    cursor: default;
+  }
+  .move-mode .container {
+    border: 2px solid rgba(255, 255, 255, 0.5);
+    cursor: move;
+  }
+  .title {
     font-size: 15px;
     font-weight: 600;
     margin-bottom: 10px;
     color: #ffffff;
-  }}
-  .bar-container {{
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+  }
+  .sparkline polyline {
+    fill: none;
+    stroke: #34c759;
+    stroke-width: 1.5;
+    stroke-linejoin: round;
+  }
+  .bar-container {
     background: rgba(255, 255, 255, 0.1);
     border-radius: 8px;
     overflow: hidden;
     height: 16px;
-  }}
-  .bar {{
+  }
+  .bar {
     height: 100%;
     background: linear-gradient(to right, #4cd964, #34c759);
-    width: {cpu_percent}%;
+    width: 0%;
     transition: width 0.4s ease;
-  }}
-  .label {{
+  }
+  .label {
     margin-top: 8px;
     font-size: 13px;
     text-align: right;
     color: #cccccc;
-  }}
-  .help-text {{
+  }
+  .help-text {
     font-size: 10px;
     color: rgba(255, 255, 255, 0.6);
     margin-top: 5px;
     text-align: center;
-    opacity: {help_opacity};
+    opacity: 1;
     transition: opacity 0.3s ease;
-  }}
+  }
 </style>
 </head>
 <body>
   <div class="container">
-    <div class="title">CPU Usage</div>
+    <div class="title">CPU Usage<svg class="sparkline" width="80" height="18"><polyline id="spark"></polyline></svg></div>
     <div class="bar-container">
-      <div class="bar"></div>
+      <div class="bar" id="bar"></div>
     </div>
-    <div class="label">{cpu_percent}%</div>
-    <div class="help-text">Ctrl+Drag to move • Double-click to lock/unlock</div>
+    <div class="label" id="label">0%</div>
+    <div class="help-text" id="help">Ctrl+Drag to move • Double-click to lock/unlock</div>
   </div>
+""" + patch_script + """
+<script>
+  bindings.cpu_percent = function(value) {
+    document.getElementById('bar').style.width = value + '%';
+    document.getElementById('label').textContent = value + '%';
+  };
+  // History is right-aligned in a fixed number of slots, newest at the right edge
+  var SPARK_SLOTS = """ + str(SPARKLINE_POINTS) + """;
+  bindings.cpu_history = function(values) {
+    var step = 80 / (SPARK_SLOTS - 1);
+    var offset = SPARK_SLOTS - values.length;
+    var points = values.map(function(value, i) {
+      return ((offset + i) * step).toFixed(1) + ',' + (17 - value * 0.16).toFixed(1);
+    });
+    document.getElementById('spark').setAttribute('points', points.join(' '));
+  };
+  bindings.move_mode = function(value) {
+    document.body.classList.toggle('move-mode', value);
+  };
+  bindings.help_visible = function(value) {
+    document.getElementById('help').style.opacity = value ? '1' : '0';
+  };
+</script>
 </body>
 </html>
 """
@@ -128,7 +410,7 @@ watchlist_template = """
 <html>
 <head>
 <style>
-  html, body {{
+  html, body {
     margin: 0;
     padding: 0;
     overflow: hidden;
@@ -137,8 +419,8 @@ watchlist_template = """
     -webkit-user-select: none;
     pointer-events: none;
     background: transparent;
-  }}
-  .widget {{
+  }
+  .widget {
     border-radius: 16px;
     padding: 16px;
     display: flex;
@@ -148,27 +430,31 @@ watchlist_template = """
     height: 128px;
     background: rgba(0, 0, 0, 0.5);
     box-shadow: 0 8px 20px rgba(0, 0, 0, 0.6);
-    border: {border_style};
-    cursor: {cursor_style};
+    border: 1px solid rgba(31, 41, 55, 0.3);
+    cursor: default;
     overflow: hidden;
     backdrop-filter: blur(12px);
-  }}
-  .header {{
+  }
+  .move-mode .widget {
+    border: 2px solid rgba(255, 255, 255, 0.5);
+    cursor: move;
+  }
+  .header {
     display: flex;
     align-items: center;
     justify-content: space-between;
     margin-bottom: 8px;
-  }}
-  .title {{
+  }
+  .title {
     color: #d1d5db;
     font-size: 12px;
     font-weight: 500;
-  }}
-  .icon {{
+  }
+  .icon {
     font-size: 16px;
     opacity: 0.7;
-  }}
-  .watchlist-content {{
+  }
+  .watchlist-content {
     display: flex;
     flex-direction: column;
     gap: 6px;
@@ -176,27 +462,41 @@ watchlist_template = """
     justify-content: space-evenly;
     overflow: hidden;
     border-radius: 12px;
-  }}
-  .watchlist-row {{
+  }
+  .watchlist-row {
     display: flex;
     justify-content: space-between;
     align-items: center;
-  }}
-  .secondary {{
+  }
+  .secondary {
     color: #9ca3af;
     font-size: 12px;
-  }}
-  .price-section {{
+  }
+  .price-section {
     display: flex;
     align-items: center;
     gap: 4px;
-  }}
-  .price {{
+  }
+  .price {
     color: white;
     font-size: 12px;
-  }}
-  .green {{ color: #4ade80; }}
-  .red {{ color: #f87171; }}
+  }
+  .green { color: #4ade80; }
+  .red { color: #f87171; }
+  .scrollbar {
+    display: none;
+    position: absolute;
+    right: 5px;
+    top: 44px;
+    bottom: 16px;
+    width: 3px;
+  }
+  .thumb {
+    position: absolute;
+    width: 100%;
+    border-radius: 2px;
+    background: rgba(255, 255, 255, 0.3);
+  }
 </style>
 </head>
 <body>
@@ -205,43 +505,325 @@ watchlist_template = """
       <div class="title">Watchlist</div>
       <div class="icon">💲</div>
     </div>
-    <div class="watchlist-content">
-      <div class="watchlist-row">
-        <div class="secondary">TSLA</div>
-        <div class="price-section">
-          <span class="price">${tsla_price}</span>
-          <span class="{tsla_color}">{tsla_arrow}</span>
-        </div>
-      </div>
-      <div class="watchlist-row">
-        <div class="secondary">NVDA</div>
-        <div class="price-section">
-          <span class="price">${nvda_price}</span>
-          <span class="{nvda_color}">{nvda_arrow}</span>
-        </div>
-      </div>
-      <div class="watchlist-row">
-        <div class="secondary">MSFT</div>
-        <div class="price-section">
-          <span class="price">${msft_price}</span>
-          <span class="{msft_color}">{msft_arrow}</span>
-        </div>
-      </div>
-      <div class="watchlist-row">
-        <div class="secondary">AAPL</div>
-        <div class="price-section">
-          <span class="price">${aapl_price}</span>
-          <span class="{aapl_color}">{aapl_arrow}</span>
-        </div>
-      </div>
+    <div class="watchlist-content" id="content"></div>
+    <div class="scrollbar" id="scrollbar"><div class="thumb" id="thumb"></div></div>
+  </div>
+""" + patch_script + """
+<script>
+  // Virtualized rows: the page keeps one node per visible slot and the
+  // widget streams the symbol, price and trend shown in each slot.
+  var slots = [];
+  function slot(index) {
+    var content = document.getElementById('content');
+    while (slots.length <= index) {
+      var row = document.createElement('div');
+      row.className = 'watchlist-row';
+      row.innerHTML = '<div class="secondary"></div>' +
+        '<div class="price-section"><span class="price"></span><span></span></div>';
+      content.appendChild(row);
+      var section = row.children[1];
+      slots.push({row: row, symbol: row.children[0], price: section.children[0], trend: section.children[1]});
+    }
+    return slots[index];
+  }
+  bindingFor = function(key) {
+    var match = /^row(\\d+)-(symbol|price|trend)$/.exec(key);
+    if (!match) return null;
+    var index = parseInt(match[1], 10), field = match[2];
+    return function(value) {
+      var nodes = slot(index);
+      if (field === 'symbol') {
+        nodes.symbol.textContent = value;
+        nodes.row.style.visibility = value ? 'visible' : 'hidden';
+      } else if (field === 'price') {
+        nodes.price.textContent = value ? '$' + value : '';
+      } else {
+        nodes.trend.className = value ? 'green' : 'red';
+        nodes.trend.textContent = value === null ? '' : (value ? '↗' : '↘');
+      }
+    };
+  };
+  bindings.move_mode = function(value) {
+    document.body.classList.toggle('move-mode', value);
+  };
+  bindings.scroll = function(value) {
+    // [top, height] of the visible window as fractions of the list, or null
+    document.getElementById('scrollbar').style.display = value ? 'block' : 'none';
+    if (value) {
+      var thumb = document.getElementById('thumb');
+      thumb.style.top = (value[0] * 100) + '%';
+      thumb.style.height = (value[1] * 100) + '%';
+    }
+  };
+</script>
+</body>
+</html>
+"""
+
+
+# Per-core CPU heatmap. The whole grid is one canvas redrawn by a single
+# binding call per tick, however many cores the machine has.
+cores_template = """
+<html>
+<head>
+<style>
+  html, body {
+    margin: 0;
+    padding: 0;
+    overflow: hidden;
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
+    color: #f0f0f0;
+    user-select: none;
+    -webkit-user-select: none;
+    pointer-events: none;
+    background: transparent;
+  }
+  .container {
+    background: rgba(20, 20, 20, 0.85);
+    backdrop-filter: blur(12px);
+    border-radius: 16px;
+    padding: 12px 20px;
+    width: 220px;
+    height: 136px;
+    box-shadow: 0 8px 20px rgba(0, 0, 0, 0.6);
+    cursor: default;
+  }
+  .move-mode .container {
+    border: 2px solid rgba(255, 255, 255, 0.5);
+    cursor: move;
+  }
+  .header {
+    display: flex;
+    justify-content: space-between;
+    align-items: baseline;
+    margin-bottom: 8px;
+  }
+  .title {
+    font-size: 15px;
+    font-weight: 600;
+    color: #ffffff;
+  }
+  .summary {
+    font-size: 11px;
+    color: #cccccc;
+  }
+  canvas {
+    display: block;
+  }
+  .help-text {
+    font-size: 10px;
+    color: rgba(255, 255, 255, 0.6);
+    margin-top: 4px;
+    text-align: center;
+    opacity: 1;
+    transition: opacity 0.3s ease;
+  }
+</style>
+</head>
+<body>
+  <div class="container">
+    <div class="header">
+      <div class="title">CPU Cores</div>
+      <div class="summary" id="summary"></div>
     </div>
+    <canvas id="heat" width="220" height='""" + str(HEATMAP_HEIGHT) + """'></canvas>
+    <div class="help-text" id="help">Ctrl+Drag to move • Double-click to lock/unlock</div>
   </div>
+""" + patch_script + """
+<script>
+  // 101-entry colour table, same ramp as ui/native.py heat_color()
+  var heatColors = [];
+  for (var p = 0; p <= 100; p++) {
+    heatColors.push('hsl(' + (120 * (1 - p / 100)).toFixed(1) + ',75%,' + (22 + p * 0.28).toFixed(1) + '%)');
+  }
+  bindings.cores = function(values) {
+    var canvas = document.getElementById('heat');
+    var ctx = canvas.getContext('2d');
+    var n = values.length;
+    ctx.clearRect(0, 0, canvas.width, canvas.height);
+    if (!n) return;
+    // Same grid as ui/native.py heatmap_grid()
+    var cols = Math.min(n, Math.ceil(Math.sqrt(n * canvas.width / canvas.height)));
+    var rows = Math.ceil(n / cols);
+    var w = canvas.width / cols, h = canvas.height / rows;
+    var gap = (w > 4 && h > 4) ? 1 : 0;
+    for (var i = 0; i < n; i++) {
+      ctx.fillStyle = heatColors[values[i]];
+      ctx.fillRect((i % cols) * w, Math.floor(i / cols) * h, w - gap, h - gap);
+    }
+  };
+  bindings.summary = function(value) {
+    document.getElementById('summary').textContent = value;
+  };
+  bindings.move_mode = function(value) {
+    document.body.classList.toggle('move-mode', value);
+  };
+  bindings.help_visible = function(value) {
+    document.getElementById('help').style.opacity = value ? '1' : '0';
+  };
+</script>
 </body>
 </html>
 """
 
+
+# Top processes table. Rows are fixed slots filled from state keys
+# row0, row1, ... each holding [name, cpu, memory] or null.
+processes_template = """
+<html>
+<head>
+<style>
+  html, body {
+    margin: 0;
+    padding: 0;
+    overflow: hidden;
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
+    color: #f0f0f0;
+    user-select: none;
+    -webkit-user-select: none;
+    pointer-events: none;
+    background: transparent;
+  }
+  .container {
+    background: rgba(20, 20, 20, 0.85);
+    backdrop-filter: blur(12px);
+    border-radius: 16px;
+    padding: 12px 20px;
+    width: 220px;
+    height: 136px;
+    box-shadow: 0 8px 20px rgba(0, 0, 0, 0.6);
+    cursor: default;
+  }
+  .move-mode .container {
+    border: 2px solid rgba(255, 255, 255, 0.5);
+    cursor: move;
+  }
+  .header {
+    display: flex;
+    justify-content: space-between;
+    align-items: baseline;
+    margin-bottom: 6px;
+  }
+  .title {
+    font-size: 15px;
+    font-weight: 600;
+    color: #ffffff;
+  }
+  .summary {
+    font-size: 11px;
+    color: #cccccc;
+  }
+  .row {
+    display: flex;
+    font-size: 12px;
+    line-height: 18px;
+  }
+  .name {
+    flex: 1;
+    overflow: hidden;
+    white-space: nowrap;
+    text-overflow: ellipsis;
+  }
+  .cpu, .mem {
+    width: 52px;
+    text-align: right;
+    color: #cccccc;
+  }
+</style>
+</head>
+<body>
+  <div class="container">
+    <div class="header">
+      <div class="title">Processes</div>
+      <div class="summary" id="summary"></div>
+    </div>
+    <div id="rows"></div>
+  </div>
+""" + patch_script + """
+<script>
+  var rows = [];
+  function row(index) {
+    while (rows.length <= index) {
+      var node = document.createElement('div');
+      node.className = 'row';
+      node.innerHTML = '<span class="name"></span><span class="cpu"></span><span class="mem"></span>';
+      document.getElementById('rows').appendChild(node);
+      rows.push(node);
+    }
+    return rows[index];
+  }
+  bindingFor = function(key) {
+    var match = /^row(\\d+)$/.exec(key);
+    if (!match) return null;
+    var index = parseInt(match[1], 10);
+    return function(value) {
+      var cells = row(index).children;
+      cells[0].textContent = value ? value[0] : '';
+      cells[1].textContent = value ? value[1] : '';
+      cells[2].textContent = value ? value[2] : '';
+    };
+  };
+  bindings.summary = function(value) {
+    document.getElementById('summary').textContent = value;
+  };
+  bindings.move_mode = function(value) {
+    document.body.classList.toggle('move-mode', value);
+  };
+</script>
+</body>
+</html>
+"""
+
+
+class PagePatcher:
+    """
+    Loads a page into a QWebEngineView once and pushes later updates as
+    small JavaScript diffs instead of re-parsing the whole document.
+    """
+    
+    def __init__(self, view, html):
+        self.view = view
+        self.rendered = {}  # Last value sent to the page per key
+        self.pending = {}   # Changes queued until the page has loaded
+        self.loaded = False
+        self.stats = {'patches': 0, 'skipped': 0, 'last_patch_ms': 0.0}
+        
+        self.view.loadFinished.connect(self._on_load_finished)
+        self.view.setHtml(html, WIDGET_BASE_URL)
+        
+    def _on_load_finished(self, ok):
+        """Flush changes queued while the page was loading."""
+        self.loaded = ok
+        if ok and self.pending:
+            self._send(self.pending)
+            self.pending = {}
+            
+    def push(self, state):
+        """Send only the keys of state that differ from what is rendered."""
+        start = time.perf_counter()
+        diff = {key: value for key, value in state.items() if self.rendered.get(key) != value}
+        if not diff:
+            self.stats['skipped'] += 1
+            return
+        self.rendered.update(diff)
+        
+        if self.loaded:
+            self._send(diff)
+        else:
+            self.pending.update(diff)
+        self.stats['last_patch_ms'] = (time.perf_counter() - start) * 1000
+        
+    def _send(self, diff):
+        """Run the page's applyState() with the given changes."""
+        self.view.page().runJavaScript(f"applyState({json.dumps(diff)});")
+        self.stats['patches'] += 1
+
 class DragOverlay(QWidget):
-    """Transparent overlay widget to handle dragging."""
+    """
+    Transparent overlay widget to handle dragging. Mouse moves only record
+    the latest target; a frame timer running at the display refresh rate
+    applies it, and z-order is restored once when the drag ends.
+    """
     
     def __init__(self, parent):
         super().__init__(parent)
@@ -253,7 +835,14 @@ class DragOverlay(QWidget):
         # Dragging state
         self.is_dragging = False
         self.drag_position = QPoint()
+        self.pending_pos = None  # Latest drag target not yet applied
         self.last_click_time = 0
+        self.wheel_delta = 0
+        
+        # Applies pending_pos at most once per display frame while dragging
+        self.frame_timer = QTimer(self)
+        self.frame_timer.setTimerType(Qt.PreciseTimer)
+        self.frame_timer.timeout.connect(self._apply_pending_move)
         
         # Make sure we get mouse events
         self.setMouseTracking(True)
@@ -262,12 +851,12 @@ class DragOverlay(QWidget):
     def mousePressEvent(self, event):
         """Handle mouse press for dragging."""
         if event.button() == Qt.LeftButton:
-            print(f"Overlay mouse press at: {event.pos()}")
+            log.debug("Overlay mouse press at: %s", event.pos())
             
             # Check for double-click
             current_time = time.time()
             if current_time - self.last_click_time < 0.3:
-                print("Double-click detected!")
+                log.debug("Double-click detected!")
                 self.main_widget.toggle_move_mode()
                 return
                 
@@ -276,34 +865,43 @@ class DragOverlay(QWidget):
             # Check if we should start dragging
             modifiers = QApplication.keyboardModifiers()
             if (modifiers & Qt.ControlModifier) or self.main_widget.is_move_mode:
-                print("Starting drag from overlay")
+                log.debug("Starting drag from overlay")
                 self.is_dragging = True
                 self.main_widget.is_dragging = True  # Update parent's state
                 self.drag_position = event.pos()
+                self.frame_timer.setInterval(screen_cache.frame_interval())
                 self.setCursor(Qt.ClosedHandCursor)
                 self.main_widget.setCursor(Qt.ClosedHandCursor)
                 
     def mouseMoveEvent(self, event):
-        """Handle mouse move for dragging."""
+        """Record the drag target; the frame timer moves the window."""
         if self.is_dragging:
-            # Calculate new position
-            delta = event.pos() - self.drag_position
-            new_pos = self.main_widget.pos() + delta
-            
-            # Apply edge snapping
-            new_pos = self.main_widget.apply_edge_snap(new_pos)
+            self.pending_pos = event.globalPos() - self.drag_position
+            if not self.frame_timer.isActive():
+                # First move of a burst is applied right away
+                self._apply_pending_move()
+                self.frame_timer.start()
+                
+    def _apply_pending_move(self):
+        """Move the window to the latest drag target, if any."""
+        if self.pending_pos is None:
+            self.frame_timer.stop()  # Pointer is idle, stop waking up
+            return
             
-            print(f"Moving widget to: {new_pos}")
+        # Apply edge snapping
+        new_pos = self.main_widget.apply_edge_snap(self.pending_pos)
+        self.pending_pos = None
+        
+        if new_pos != self.main_widget.pos():
+            log.debug("Moving widget to: %s", new_pos)
             self.main_widget.move(new_pos)
-            
-            # Reapply desktop level after moving
-            if self.main_widget.hwnd:
-                QTimer.singleShot(10, self.main_widget._reapply_desktop_level)
                 
     def mouseReleaseEvent(self, event):
         """Handle mouse release."""
         if event.button() == Qt.LeftButton and self.is_dragging:
-            print("Ending drag from overlay")
+            log.debug("Ending drag from overlay")
+            self._apply_pending_move()
+            self.frame_timer.stop()
             self.is_dragging = False
             self.main_widget.is_dragging = False  # Update parent's state
             if not self.main_widget.is_move_mode:
@@ -313,10 +911,23 @@ class DragOverlay(QWidget):
                 self.setCursor(Qt.OpenHandCursor)
                 self.main_widget.setCursor(Qt.OpenHandCursor)
             
+            # Reapply desktop level once now that the window has settled
+            if self.main_widget.hwnd:
+                self.main_widget._reapply_desktop_level()
+            
             # Save position after drag ends
             if hasattr(self.main_widget, 'save_position'):
                 QTimer.singleShot(50, self.main_widget.save_position)
                 
+    def wheelEvent(self, event):
+        """Scroll widgets with more content than fits."""
+        # Accumulate so high-resolution touchpads scroll too
+        self.wheel_delta += event.angleDelta().y()
+        steps = int(self.wheel_delta / 120)
+        if steps:
+            self.wheel_delta -= steps * 120
+            self.main_widget.scroll_rows(-steps)
+            
     def enterEvent(self, event):
         """Show help when hovering."""
         self.main_widget.show_help()
@@ -325,29 +936,62 @@ class DragOverlay(QWidget):
         """Hide help when leaving."""
         self.main_widget.hide_help()
 
-class WatchlistWidget(QMainWindow):
-    def __init__(self):
+# Render backends a widget can use for its content
+BACKENDS = ('web', 'native')
+
+
+class DesktopWidgetWindow(QMainWindow):
+    """
+    Frameless desktop-level window shared by all widget types. Subclasses
+    provide the content through a render backend:
+      - 'web':    QWebEngineView loaded once with the widget's HTML template
+      - 'native': QPainter view from ui/native.py, no QtWebEngine needed
+    Both backends accept the same state dictionaries via push_state().
+    """
+    
+    widget_name = "widget"        # Unique identifier for position saving
+    widget_size = (160, 160)
+    default_position = (50, 50)
+    update_interval = 1000        # Default ms between update_html() ticks; 'update_interval' option overrides
+    html = None                   # Web template
+    native_view_class = None      # Native view class
+    
+    @classmethod
+    def prepare(cls, options):
+        """
+        Fetch or compute what the first paint needs, before the window
+        exists. Runs on a startup worker thread next to the other widgets'
+        preparation, so it must not touch Qt. The default does nothing.
+        """
+        pass
+        
+    def __init__(self, backend='web', options=None):
         super().__init__()
         
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}', expected one of {BACKENDS}")
+        
         # Widget state - initialize all state variables first
+        self.backend = backend
+        self.options = options or {}  # Widget entry from startup_config.json
         self.is_dragging = False
         self.is_move_mode = False
         self.snap_margin = 30
         self.hwnd = None
         self.help_visible = True
-        self.widget_name = "watchlist"  # Unique identifier for position saving
         self.is_initializing = True  # Flag to prevent saving during startup
+        self._first_paint_callback = None
         
-        # Mock stock data - replace with real API calls
-        self.stocks = {
-            'TSLA': {'price': 248.50, 'change': 1.2},
-            'NVDA': {'price': 875.30, 'change': -0.8},
-            'MSFT': {'price': 378.85, 'change': 0.5},
-            'AAPL': {'price': 189.25, 'change': 1.84}
-        }
+    def setup_widget(self):
+        """Build the window once subclass state is in place."""
+        # Single-shot timer coalescing position saves from move events
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(100)
+        self.save_timer.timeout.connect(self.save_position)
         
         self.setup_window()
-        self.setup_web_view()
+        self.setup_view()
         self.setup_overlay()
         self.setup_timer()
         self.setup_desktop_level()
@@ -361,9 +1005,32 @@ class WatchlistWidget(QMainWindow):
         # Show help initially, then fade after 3 seconds
         QTimer.singleShot(3000, self.fade_help)
         
+    def on_first_paint(self, callback):
+        """
+        Call callback(widget) once the content is first drawn. For the web
+        backend this is when the page has finished loading.
+        """
+        self._first_paint_callback = callback
+        if self.backend == 'native':
+            self.view.installEventFilter(self)
+        else:
+            self.view.loadFinished.connect(self._first_painted)
+            
+    def eventFilter(self, obj, event):
+        """Watch the native view for its first paint."""
+        if obj is self.view and event.type() == QEvent.Paint:
+            self.view.removeEventFilter(self)
+            self._first_painted()
+        return super().eventFilter(obj, event)
+        
+    def _first_painted(self, *args):
+        callback, self._first_paint_callback = self._first_paint_callback, None
+        if callback is not None:
+            callback(self)
+            
     def load_position(self):
         """Load and apply saved widget position."""
-        saved_pos = position_manager.get_position(self.widget_name, 320, 50)
+        saved_pos = position_manager.get_position(self.widget_name, *self.default_position)
         self.move(saved_pos)
         print(f"Loaded {self.widget_name} widget position: {saved_pos.x()}, {saved_pos.y()}")
         
@@ -378,29 +1045,37 @@ class WatchlistWidget(QMainWindow):
         super().moveEvent(event)
         # Only save if we're not currently dragging and not initializing
         if not self.is_dragging and not self.is_initializing:
-            QTimer.singleShot(100, self.save_position)  # Small delay to avoid spam
+            self.save_timer.start()  # Restarts, so a burst of moves saves once
         
     def setup_window(self):
         """Configure the main window properties."""
+        # Remove WindowStaysOnTopHint since we want desktop level
         self.setWindowFlags(
             Qt.FramelessWindowHint |
             Qt.Tool
         )
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.setAttribute(Qt.WA_NoSystemBackground, True)
-        self.setFixedSize(160, 160)  # Small widget size
-        
-    def setup_web_view(self):
-        """Set up the web engine view."""
-        self.view = QWebEngineView(self)
-        self.view.setStyleSheet("background: transparent;")
-        self.view.setAttribute(Qt.WA_TranslucentBackground)
-        self.view.page().setBackgroundColor(Qt.transparent)
-        
-        # Additional settings for better transparency
-        self.view.setAttribute(Qt.WA_OpaquePaintEvent, False)
-        self.view.setAttribute(Qt.WA_NoSystemBackground, True)
+        self.setFixedSize(*self.widget_size)
         
+    def setup_view(self):
+        """Set up the content view for the selected backend."""
+        if self.backend == 'native':
+            self.view = self.native_view_class(self)
+            self.renderer = self.view
+        else:
+            self.view = create_web_view(self)
+            self.view.setStyleSheet("background: transparent;")
+            self.view.setAttribute(Qt.WA_TranslucentBackground)
+            self.view.page().setBackgroundColor(Qt.transparent)
+            
+            # Additional settings for better transparency
+            self.view.setAttribute(Qt.WA_OpaquePaintEvent, False)
+            self.view.setAttribute(Qt.WA_NoSystemBackground, True)
+            
+            # Load the page once; later ticks only patch changed values
+            self.renderer = PagePatcher(self.view, self.html)
+            
         self.view.setGeometry(self.rect())
         self.update_html()
         
@@ -410,10 +1085,29 @@ class WatchlistWidget(QMainWindow):
         self.overlay.show()
         
     def setup_timer(self):
-        """Set up the update timer."""
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_html)
-        self.timer.start(5000)  # Update every 5 seconds
+        """Register the periodic update with the shared tick scheduler."""
+        interval = self.options.get('update_interval', self.update_interval)
+        self.refresh_policy = RefreshPolicy(interval)
+        self.tick_job = get_tick_scheduler().every(interval, self._tick)
+        
+    def _tick(self):
+        """Update, then skip ticks until the next update is worth doing."""
+        self.update_html()
+        get_tick_scheduler().defer(self.tick_job, self.next_update_delay())
+        
+    def next_update_delay(self):
+        """Milliseconds until the next useful update; widgets with market data override this."""
+        return self.refresh_policy.delay_ms(visible=self.is_shown())
+        
+    def is_shown(self):
+        """True while the window is on screen and not minimized."""
+        handle = self.windowHandle()
+        return self.isVisible() and not self.isMinimized() and (handle is None or handle.isExposed())
+        
+    def resume_updates(self):
+        """Bring a tick deferred while hidden back to the next regular one."""
+        if hasattr(self, 'tick_job'):
+            get_tick_scheduler().defer(self.tick_job, 0)
         
     def setup_desktop_level(self):
         """Configure desktop-level positioning (Windows only)."""
@@ -427,11 +1121,13 @@ class WatchlistWidget(QMainWindow):
         try:
             self.hwnd = int(self.winId())
             
+            # Set window to desktop level (behind applications, above wallpaper)
             HWND_BOTTOM = 1
             SWP_NOMOVE = 0x0002
             SWP_NOSIZE = 0x0001
             SWP_NOACTIVATE = 0x0010
             
+            # Set extended window style
             WS_EX_TOOLWINDOW = 0x00000080
             WS_EX_NOACTIVATE = 0x08000000
             
@@ -439,6 +1135,7 @@ class WatchlistWidget(QMainWindow):
             new_style = current_style | WS_EX_TOOLWINDOW | WS_EX_NOACTIVATE
             ctypes.windll.user32.SetWindowLongW(self.hwnd, -20, new_style)
             
+            # Position at bottom of Z-order (desktop level)
             ctypes.windll.user32.SetWindowPos(
                 self.hwnd, 
                 HWND_BOTTOM, 
@@ -471,49 +1168,38 @@ class WatchlistWidget(QMainWindow):
         """Fade out the help text."""
         if not self.is_move_mode:
             self.help_visible = False
-            self.update_html()
+            self.push_state()
             
     def show_help(self):
         """Show help text."""
         if not self.is_move_mode:
             self.help_visible = True
-            self.update_html()
+            self.push_state()
             
     def hide_help(self):
         """Hide help text."""
         if not self.is_move_mode:
             self.help_visible = False
-            self.update_html()
+            self.push_state()
             
     def update_html(self):
-        """Update the HTML content with watchlist data."""
-        import random
-        
-        # Simulate stock price changes
-        data = {}
-        for symbol, stock in self.stocks.items():
-            # Simulate slight changes
-            change_factor = 1 + (random.random() - 0.5) * 0.02  # ±1% variation
-            current_change = stock['change'] * change_factor
-            current_price = stock['price'] * (1 + current_change/100)
-            
-            is_positive = current_change >= 0
-            symbol_lower = symbol.lower()
-            
-            data[f'{symbol_lower}_price'] = f"{current_price:.2f}"
-            data[f'{symbol_lower}_color'] = 'green' if is_positive else 'red'
-            data[f'{symbol_lower}_arrow'] = '↗' if is_positive else '↘'
+        """Refresh the widget's data and push the changes to the view."""
+        self.push_state()
         
-        # Determine styling based on mode
-        if self.is_move_mode:
-            data['border_style'] = "2px solid rgba(255, 255, 255, 0.5)"
-            data['cursor_style'] = "move"
-        else:
-            data['border_style'] = "1px solid rgba(31, 41, 55, 0.3)"
-            data['cursor_style'] = "default"
+    def get_state(self):
+        """Return the full state dictionary rendered by the view."""
+        return {
+            'move_mode': self.is_move_mode,
+            'help_visible': self.help_visible or self.is_move_mode
+        }
         
-        html = watchlist_template.format(**data)
-        self.view.setHtml(html)
+    def push_state(self):
+        """Push the current state to the view; only changed keys are rendered."""
+        self.renderer.push(self.get_state())
+        
+    def scroll_rows(self, steps):
+        """Scroll the content by rows; widgets with lists override this."""
+        pass
         
     def toggle_move_mode(self):
         """Toggle between move mode and locked mode."""
@@ -530,20 +1216,24 @@ class WatchlistWidget(QMainWindow):
             self.overlay.setCursor(Qt.ArrowCursor)
             self.help_visible = False
             
-        self.update_html()
+        self.push_state()
         
     def apply_edge_snap(self, pos):
         """Apply edge snapping to position."""
-        screen = QApplication.desktop().screenGeometry()
+        screen = screen_cache.geometry()
         widget_rect = self.frameGeometry()
         
+        # Snap to left edge
         if pos.x() <= self.snap_margin:
             pos.setX(0)
+        # Snap to right edge
         elif pos.x() + widget_rect.width() >= screen.width() - self.snap_margin:
             pos.setX(screen.width() - widget_rect.width())
             
+        # Snap to top edge  
         if pos.y() <= self.snap_margin:
             pos.setY(0)
+        # Snap to bottom edge
         elif pos.y() + widget_rect.height() >= screen.height() - self.snap_margin:
             pos.setY(screen.height() - widget_rect.height())
             
@@ -567,257 +1257,281 @@ class WatchlistWidget(QMainWindow):
     def set_transparency(self, alpha=0.9):
         """Set window transparency."""
         self.setWindowOpacity(alpha)
-
-
-class DesktopWebWidget(QMainWindow):
-    def __init__(self):
-        super().__init__()
         
-        # Widget state - initialize all state variables first
-        self.is_dragging = False
-        self.is_move_mode = False
-        self.snap_margin = 30
-        self.hwnd = None
-        self.help_visible = True
-        self.widget_name = "cpu"  # Unique identifier for position saving
-        self.is_initializing = True  # Flag to prevent saving during startup
+    def showEvent(self, event):
+        """Resume normal updates when the window is shown again."""
+        super().showEvent(event)
+        self.resume_updates()
         
-        self.setup_window()
-        self.setup_web_view()
-        self.setup_overlay()
-        self.setup_timer()
-        self.setup_desktop_level()
+    def changeEvent(self, event):
+        """Resume normal updates when the window is restored from minimized."""
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange and not self.isMinimized():
+            self.resume_updates()
         
-        # Load and apply saved position
-        self.load_position()
+    def closeEvent(self, event):
+        """Stop periodic updates with the window."""
+        get_tick_scheduler().cancel(self.tick_job)
+        super().closeEvent(event)
+
+
+class QuoteBridge(QObject):
+    """Carries quotes from the feed's worker thread to the GUI thread."""
+    quotes_ready = pyqtSignal(object)
+
+
+class WatchlistWidget(DesktopWidgetWindow):
+    widget_name = "watchlist"
+    widget_size = (160, 160)  # Small widget size
+    default_position = (320, 50)
+    update_interval = 5000  # Update every 5 seconds
+    html = watchlist_template
+    native_view_class = NativeWatchlistView
+    
+    default_symbols = ['TSLA', 'NVDA', 'MSFT', 'AAPL']
+    visible_rows = 4  # Row slots that fit the tile; longer lists scroll
+    default_market_hours = {"open": "09:30", "close": "16:00", "timezone": "America/New_York"}
+    
+    def __init__(self, backend='web', options=None):
+        super().__init__(backend, options)
         
-        # Initialization complete - now we can save positions
-        self.is_initializing = False
+        # Any number of symbols; only the visible window is fetched and rendered
+        self.symbols = list(self.options.get('symbols', self.default_symbols))
+        self.scroll_offset = 0
+        self.quotes = {}  # symbol -> latest Quote
         
-        # Show help initially, then fade after 3 seconds
-        QTimer.singleShot(3000, self.fade_help)
+        # Quotes are fetched in one batch per tick on a worker thread and
+        # delivered back through a queued signal, so the GUI never blocks
+        self.feed = QuoteFeed(create_provider(self.options.get('provider')))
+        self.quote_bridge = QuoteBridge()
+        self.quote_bridge.quotes_ready.connect(self.on_quotes)
         
-    def load_position(self):
-        """Load and apply saved widget position."""
-        saved_pos = position_manager.get_position(self.widget_name, 50, 50)
-        self.move(saved_pos)
-        print(f"Loaded {self.widget_name} widget position: {saved_pos.x()}, {saved_pos.y()}")
+        # Outside trading hours quotes don't move, so ticks wait for the open
+        self.market = MarketHours.from_config(self.options.get('market_hours', self.default_market_hours))
         
-    def save_position(self):
-        """Save current widget position."""
-        pos = self.pos()
-        position_manager.set_position(self.widget_name, pos.x(), pos.y())
-        print(f"Saved {self.widget_name} widget position: {pos.x()}, {pos.y()}")
+        self.setup_widget()
         
-    def moveEvent(self, event):
-        """Handle move events to save position."""
-        super().moveEvent(event)
-        # Only save if we're not currently dragging and not initializing
-        if not self.is_dragging and not self.is_initializing:
-            QTimer.singleShot(100, self.save_position)  # Small delay to avoid spam
+    @classmethod
+    def prepare(cls, options):
+        """Warm the shared quote cache with the first page so the first tick is served from it."""
+        symbols = list(options.get('symbols', cls.default_symbols))[:2 * cls.visible_rows]
+        quote_cache.get_quotes(symbols, create_provider(options.get('provider')))
         
-    def setup_window(self):
-        """Configure the main window properties."""
-        # Remove WindowStaysOnTopHint since we want desktop level
-        self.setWindowFlags(
-            Qt.FramelessWindowHint |
-            Qt.Tool
-        )
-        self.setAttribute(Qt.WA_TranslucentBackground)
-        self.setFixedSize(260, 120)
-        
-    def setup_web_view(self):
-        """Set up the web engine view."""
-        self.view = QWebEngineView(self)
-        self.view.setStyleSheet("background: transparent;")
-        self.view.setAttribute(Qt.WA_TranslucentBackground)
-        self.view.page().setBackgroundColor(Qt.transparent)
-        self.view.setGeometry(self.rect())
-        self.update_html()
+    def visible_symbols(self):
+        """Symbols currently shown in the row slots."""
+        return self.symbols[self.scroll_offset:self.scroll_offset + self.visible_rows]
         
-    def setup_overlay(self):
-        """Set up the transparent drag overlay."""
-        self.overlay = DragOverlay(self)
-        self.overlay.show()
-        print("Drag overlay created and shown")
+    def update_html(self):
+        """Request fresh quotes for the visible rows and the next page."""
+        end = self.scroll_offset + 2 * self.visible_rows
+        self.feed.request(self.symbols[self.scroll_offset:end], self.quote_bridge.quotes_ready.emit)
         
-    def setup_timer(self):
-        """Set up the update timer."""
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_html)
-        self.timer.start(1000)  # Update every second
+    def next_update_delay(self):
+        """Like the base policy, but also wait for the market to open."""
+        return self.refresh_policy.delay_ms(visible=self.is_shown(), market=self.market)
         
-    def setup_desktop_level(self):
-        """Configure desktop-level positioning (Windows only)."""
-        try:
-            QTimer.singleShot(200, self._apply_desktop_level)
-        except Exception as e:
-            print(f"Warning: Could not set desktop level positioning: {e}")
-            
-    def _apply_desktop_level(self):
-        """Apply desktop level positioning to stay behind applications."""
-        try:
-            self.hwnd = int(self.winId())
-            
-            # Set window to desktop level (behind applications, above wallpaper)
-            HWND_BOTTOM = 1
-            SWP_NOMOVE = 0x0002
-            SWP_NOSIZE = 0x0001
-            SWP_NOACTIVATE = 0x0010
-            
-            # Set extended window style
-            WS_EX_TOOLWINDOW = 0x00000080
-            WS_EX_NOACTIVATE = 0x08000000
-            
-            current_style = ctypes.windll.user32.GetWindowLongW(self.hwnd, -20)
-            new_style = current_style | WS_EX_TOOLWINDOW | WS_EX_NOACTIVATE
-            ctypes.windll.user32.SetWindowLongW(self.hwnd, -20, new_style)
-            
-            # Position at bottom of Z-order (desktop level)
-            ctypes.windll.user32.SetWindowPos(
-                self.hwnd, 
-                HWND_BOTTOM, 
-                0, 0, 0, 0, 
-                SWP_NOMOVE | SWP_NOSIZE | SWP_NOACTIVATE
-            )
-            
-            print("Widget positioned at desktop level - applications will appear on top")
-            
-        except Exception as e:
-            print(f"Warning: Desktop level setup failed: {e}")
-            
-    def _reapply_desktop_level(self):
-        """Reapply desktop level after moving."""
-        if self.hwnd:
-            try:
-                HWND_BOTTOM = 1
-                SWP_NOMOVE = 0x0002
-                SWP_NOSIZE = 0x0001
-                SWP_NOACTIVATE = 0x0010
-                
-                ctypes.windll.user32.SetWindowPos(
-                    self.hwnd, 
-                    HWND_BOTTOM, 
-                    0, 0, 0, 0, 
-                    SWP_NOMOVE | SWP_NOSIZE | SWP_NOACTIVATE
-                )
-            except:
-                pass
-                
-    def fade_help(self):
-        """Fade out the help text."""
-        if not self.is_move_mode:
-            self.help_visible = False
-            self.update_html()
-            
-    def show_help(self):
-        """Show help text."""
-        if not self.is_move_mode:
-            self.help_visible = True
+    def on_quotes(self, quotes):
+        """Store quotes delivered by the feed and push the changes."""
+        self.quotes.update(quotes)
+        self.push_state()
+        
+    def scroll_rows(self, steps):
+        """Scroll the list by whole rows, clamped to its ends."""
+        max_offset = max(0, len(self.symbols) - self.visible_rows)
+        offset = max(0, min(self.scroll_offset + steps, max_offset))
+        if offset != self.scroll_offset:
+            self.scroll_offset = offset
+            self.push_state()  # Cached quotes show immediately
             self.update_html()
+        
+    def get_state(self):
+        """Row slots, scroll position and mode for the watchlist view."""
+        state = {'move_mode': self.is_move_mode}
+        visible = self.visible_symbols()
+        for index in range(self.visible_rows):
+            symbol = visible[index] if index < len(visible) else ''
+            quote = self.quotes.get(symbol)
+            state[f'row{index}-symbol'] = symbol
+            state[f'row{index}-price'] = f"{quote.price:.2f}" if quote else ''
+            state[f'row{index}-trend'] = quote.change >= 0 if quote else None
             
-    def hide_help(self):
-        """Hide help text."""
-        if not self.is_move_mode:
-            self.help_visible = False
-            self.update_html()
+        if len(self.symbols) > self.visible_rows:
+            # Thumb keeps a minimum size so very long lists stay scrollable
+            thumb = max(self.visible_rows / len(self.symbols), 0.1)
+            max_offset = len(self.symbols) - self.visible_rows
+            state['scroll'] = [round(self.scroll_offset / max_offset * (1 - thumb), 4),
+                               round(thumb, 4)]
+        else:
+            state['scroll'] = None
+        return state
+        
+    def closeEvent(self, event):
+        """Stop the quote feed with the window."""
+        self.feed.shutdown()
+        super().closeEvent(event)
+
+
+class DesktopWebWidget(DesktopWidgetWindow):
+    widget_name = "cpu"
+    widget_size = (260, 120)
+    default_position = (50, 50)
+    update_interval = 1000  # Update every second
+    html = html_template
+    native_view_class = NativeCpuView
+    
+    def __init__(self, backend='web', options=None):
+        super().__init__(backend, options)
+        self.cpu_percent = 0
+        
+        # Sparkline resolution in seconds per point: 1 (last minute),
+        # 10 (last 10 minutes) or 60 (last hour)
+        self.history_step = self.options.get('history_step', 1)
+        steps = metrics_collector.cpu_history.steps
+        if self.history_step not in steps:
+            print(f"Warning: history_step must be one of {steps}, got {self.history_step!r}; using {steps[0]}")
+            self.history_step = steps[0]
+        self.cpu_history = []
+        
+        # psutil is sampled by the shared collector thread; this widget only
+        # reads its latest snapshot, so a slow sample never stalls the GUI
+        metrics_collector.acquire()
+        
+        self.setup_widget()
         
     def update_html(self):
-        """Update the HTML content."""
-        cpu = int(psutil.cpu_percent())
+        """Show the latest CPU sample from the metrics collector."""
+        snapshot = metrics_collector.latest()
+        if snapshot is not None:
+            self.cpu_percent = int(snapshot.cpu_percent)
+        history = metrics_collector.cpu_history.last(self.history_step, SPARKLINE_POINTS)
+        self.cpu_history = [int(round(value)) for value in history]
+        self.push_state()
         
-        # Determine styling based on mode
-        if self.is_move_mode:
-            border_style = "2px solid rgba(255, 255, 255, 0.5)"
-            cursor_style = "move"
-        else:
-            border_style = "none"
-            cursor_style = "default"
-            
-        help_opacity = "1" if self.help_visible or self.is_move_mode else "0"
+    def get_state(self):
+        """CPU value, mode and help visibility for the CPU view."""
+        state = super().get_state()
+        state['cpu_percent'] = self.cpu_percent
+        state['cpu_history'] = self.cpu_history
+        return state
         
-        html = html_template.format(
-            cpu_percent=cpu,
-            border_style=border_style,
-            cursor_style=cursor_style,
-            help_opacity=help_opacity
-        )
-        self.view.setHtml(html)
+    def closeEvent(self, event):
+        """Let the collector stop once no widget needs it."""
+        metrics_collector.release()
+        super().closeEvent(event)
+
+
+class CpuCoresWidget(DesktopWidgetWindow):
+    """
+    Per-core CPU heatmap for machines with many cores. Each tick sends the
+    whole core list as one state value, so the view redraws the grid in a
+    single batched pass instead of updating one element per core.
+    """
+    widget_name = "cpu_cores"
+    widget_size = (260, 160)
+    default_position = (50, 190)
+    update_interval = 1000
+    html = cores_template
+    native_view_class = NativeCoresView
+    
+    def __init__(self, backend='web', options=None):
+        super().__init__(backend, options)
+        self.cores = []
+        self.summary = ''
+        metrics_collector.acquire()
         
-    def toggle_move_mode(self):
-        """Toggle between move mode and locked mode."""
-        self.is_move_mode = not self.is_move_mode
+        self.setup_widget()
         
-        if self.is_move_mode:
-            print("Move mode ON - Click and drag to move, or hold Ctrl+drag")
-            self.setCursor(Qt.OpenHandCursor)
-            self.overlay.setCursor(Qt.OpenHandCursor)
-            self.help_visible = True
-        else:
-            print("Move mode OFF - Widget locked. Hold Ctrl+drag to move")
-            self.setCursor(Qt.ArrowCursor)
-            self.overlay.setCursor(Qt.ArrowCursor)
-            self.help_visible = False
-            
-        self.update_html()
+    def update_html(self):
+        """Show the latest per-core sample from the metrics collector."""
+        snapshot = metrics_collector.latest()
+        if snapshot is not None:
+            self.cores = [min(100, max(0, int(round(value)))) for value in snapshot.cpu_per_core]
+            self.summary = f"{len(self.cores)} cores • avg {int(snapshot.cpu_percent)}%"
+        self.push_state()
         
-    def apply_edge_snap(self, pos):
-        """Apply edge snapping to position."""
-        screen = QApplication.desktop().screenGeometry()
-        widget_rect = self.frameGeometry()
+    def get_state(self):
+        """Core values, summary line, mode and help visibility."""
+        state = super().get_state()
+        state['cores'] = self.cores
+        state['summary'] = self.summary
+        return state
         
-        # Snap to left edge
-        if pos.x() <= self.snap_margin:
-            pos.setX(0)
-        # Snap to right edge
-        elif pos.x() + widget_rect.width() >= screen.width() - self.snap_margin:
-            pos.setX(screen.width() - widget_rect.width())
-            
-        # Snap to top edge  
-        if pos.y() <= self.snap_margin:
-            pos.setY(0)
-        # Snap to bottom edge
-        elif pos.y() + widget_rect.height() >= screen.height() - self.snap_margin:
-            pos.setY(screen.height() - widget_rect.height())
-            
-        return pos
+    def closeEvent(self, event):
+        """Let the collector stop once no widget needs it."""
+        metrics_collector.release()
+        super().closeEvent(event)
+
+
+class ProcessesWidget(DesktopWidgetWindow):
+    """
+    Top-N processes by CPU or memory. Scanning happens on the shared
+    process monitor thread; this widget only formats its latest result.
+    """
+    widget_name = "processes"
+    widget_size = (260, 160)
+    default_position = (50, 360)
+    update_interval = 2000
+    html = processes_template
+    native_view_class = NativeProcessesView
+    
+    max_rows = 6  # Rows that fit the tile
+    
+    def __init__(self, backend='web', options=None):
+        super().__init__(backend, options)
+        self.sort = self.options.get('sort', 'cpu')  # 'cpu' or 'memory'
+        self.top_n = max(1, min(self.options.get('top_n', 5), self.max_rows))
+        self.rows = []
+        self.summary = ''
+        process_monitor.acquire(self.top_n)
         
-    def keyPressEvent(self, event):
-        """Handle key press events."""
-        if event.key() == Qt.Key_Escape:
-            if self.is_move_mode:
-                self.toggle_move_mode()
-        super().keyPressEvent(event)
+        self.setup_widget()
         
-    def resizeEvent(self, event):
-        """Handle resize events to update overlay."""
-        super().resizeEvent(event)
-        if hasattr(self, 'overlay'):
-            self.overlay.setGeometry(self.rect())
-        if hasattr(self, 'view'):
-            self.view.setGeometry(self.rect())
+    def update_html(self):
+        """Show the newest scan from the process monitor."""
+        top = process_monitor.latest()
+        if top is not None:
+            ranked = top.by_memory if self.sort == 'memory' else top.by_cpu
+            self.rows = [[p.name, f"{p.cpu_percent:.1f}%", f"{p.memory_rss / 1048576:.0f} MB"]
+                         for p in ranked[:self.top_n]]
+            self.summary = f"{top.process_count} procs"
+        self.push_state()
         
-    def set_transparency(self, alpha=0.9):
-        """Set window transparency."""
-        self.setWindowOpacity(alpha)
+    def get_state(self):
+        """Row slots, summary line and mode."""
+        state = {'move_mode': self.is_move_mode, 'summary': self.summary}
+        for index in range(self.top_n):
+            state[f'row{index}'] = self.rows[index] if index < len(self.rows) else None
+        return state
+        
+    def closeEvent(self, event):
+        """Let the monitor stop once no widget needs it."""
+        process_monitor.release()
+        super().closeEvent(event)
+
 
 def main():
     import sys
-    app = QApplication(sys.argv)
     
-    # Check command line argument to choose widget type
+    # Check command line arguments to choose widget type and backend
     widget_type = "cpu"  # default
+    backend = "web"  # default
     if len(sys.argv) > 1:
         widget_type = sys.argv[1].lower()
+    if len(sys.argv) > 2:
+        backend = sys.argv[2].lower()
+    
+    if backend == "web":
+        load_web_engine()
+    app = QApplication(sys.argv)
     
     if widget_type == "watchlist":
         # Create watchlist widget
-        w = WatchlistWidget()
+        w = WatchlistWidget(backend)
         print("Watchlist Widget loaded!")
-        print("Shows: TSLA, NVDA, MSFT, AAPL prices")
+        print(f"Shows: {', '.join(w.symbols)} prices (scroll for more)")
     else:
         # Create CPU widget (default)
-        w = DesktopWebWidget()
+        w = DesktopWebWidget(backend)
         print("CPU Widget loaded!")
     
     w.show()
@@ -833,11 +1547,13 @@ def main():
     print("Usage:")
     print("- python web.py          (CPU widget)")
     print("- python web.py watchlist (Watchlist widget)")
+    print("- python web.py cpu native (CPU widget without QtWebEngine)")
     
     sys.exit(app.exec_())
 
 def run_both():
     """Run both widgets at the same time"""
+    load_web_engine()
     app = QApplication(sys.argv)
     
     # Create CPU widget